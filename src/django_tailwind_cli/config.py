@@ -111,24 +111,53 @@ Examples of complete settings configuration:
     ]
 """
 
+import contextlib
 import functools
+import json
 import os
 import platform
 import re
 import shutil
+import stat
 import subprocess
 import tempfile
 import time
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
-from django_tailwind_cli.utils import http
 from django.conf import settings
+from django.core.signals import setting_changed
 from semver import Version
 
 FALLBACK_VERSION = "4.1.3"
+_FALLBACK = Version.parse(FALLBACK_VERSION)
+
+# How long a resolved "latest" release tag is reused before GitHub is asked again.
+_VERSION_CACHE_TTL = 3600
+
+# Sentinel for settings whose default depends on other settings (or whose
+# explicit None must be told apart from "not configured").
+_UNSET: Any = object()
+
+# Every TAILWIND_CLI_* setting read while building the configuration, with the
+# value used when it is absent from the Django settings.
+_SETTING_DEFAULTS: dict[str, Any] = {
+    "TAILWIND_CLI_VERSION": "latest",
+    "TAILWIND_CLI_PATH": None,
+    "TAILWIND_CLI_ASSET_NAME": _UNSET,
+    "TAILWIND_CLI_SRC_REPO": _UNSET,
+    "TAILWIND_CLI_SRC_CSS": None,
+    "TAILWIND_CLI_DIST_CSS": _UNSET,
+    "TAILWIND_CLI_CSS_MAP": None,
+    "TAILWIND_CLI_AUTOMATIC_DOWNLOAD": True,
+    "TAILWIND_CLI_USE_DAISY_UI": False,
+    "TAILWIND_CLI_USE_SYSTEM_BINARY": False,
+    "TAILWIND_CLI_SYSTEM_BINARY_NAME": None,
+    "TAILWIND_CLI_AUTO_SOURCE_EXTERNAL_APPS": False,
+    "TAILWIND_CLI_REQUEST_TIMEOUT": 10,
+}
 
 
 class CSSEntry(NamedTuple):
@@ -140,18 +169,35 @@ class CSSEntry(NamedTuple):
     dist_css_base: str  # Relative path for template tag (e.g., "admin.output.css")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     version_str: str
     version: Version
     cli_path: Path
     download_url: str
-    css_entries: list[CSSEntry]
+    css_entries: tuple[CSSEntry, ...]
     overwrite_default_config: bool = True
     automatic_download: bool = True
     use_daisy_ui: bool = False
     uses_system_binary: bool = False
     auto_source_external_apps: bool = False
+    # When a "latest" version was fetched (None if pinned), and whether the lookup
+    # failed so FALLBACK_VERSION is used instead; get_config() expires on these
+    version_fetched_at: float | None = field(default=None, repr=False, compare=False)
+    is_fallback_version: bool = field(default=False, repr=False, compare=False)
+
+    # Commands for the first entry, built once since all inputs are immutable
+    _watch_cmd: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _build_cmd: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.css_entries:
+            watch_cmd = tuple(self.get_watch_cmd(self.css_entries[0]))
+            build_cmd = tuple(self.get_build_cmd(self.css_entries[0]))
+        else:
+            watch_cmd = build_cmd = ()
+        object.__setattr__(self, "_watch_cmd", watch_cmd)
+        object.__setattr__(self, "_build_cmd", build_cmd)
 
     # Backward compatibility properties
     @property
@@ -196,12 +242,13 @@ class Config:
     @property
     def watch_cmd(self) -> list[str]:
         """Return watch command for first entry (backward compatibility)."""
-        return self.get_watch_cmd(self.css_entries[0])
+        # A fresh list, so callers may extend it without touching the precomputed tuple
+        return list(self._watch_cmd)
 
     @property
     def build_cmd(self) -> list[str]:
         """Return build command for first entry (backward compatibility)."""
-        return self.get_build_cmd(self.css_entries[0])
+        return list(self._build_cmd)
 
 
 class PlatformInfo(NamedTuple):
@@ -218,14 +265,38 @@ class VersionCache(NamedTuple):
     version_str: str
     version: Version
     timestamp: float
+    etag: str | None = None
 
 
-def _validate_required_settings() -> None:
+class _ResolvedVersion(NamedTuple):
+    """Version chosen for the configuration, and how long it may be reused."""
+
+    version_str: str
+    version: Version
+    fetched_at: float | None = None  # Only set for "latest" lookups
+    is_fallback: bool = False
+
+
+def _load_settings() -> dict[str, Any]:
+    """Read all TAILWIND_CLI_* settings in a single pass.
+
+    Returns:
+        dict: Setting name to configured value, or its default from _SETTING_DEFAULTS.
+    """
+    return {key: getattr(settings, key, default) for key, default in _SETTING_DEFAULTS.items()}
+
+
+def _validate_required_settings(values: dict[str, Any] | None = None) -> None:
     """Validate that required Django settings are configured.
 
+    Args:
+        values: Settings as returned by _load_settings(). Read from Django settings when omitted.
+
     Raises:
         ValueError: If required settings are missing or invalid.
     """
+    if values is None:
+        values = _load_settings()
     if settings.STATICFILES_DIRS is None or len(settings.STATICFILES_DIRS) == 0:
         raise ValueError(
             "STATICFILES_DIRS is empty. Please add a path to your static files. "
@@ -233,41 +304,44 @@ def _validate_required_settings() -> None:
         )
 
     # Validate TAILWIND_CLI_ASSET_NAME if set
-    asset_name = getattr(settings, "TAILWIND_CLI_ASSET_NAME", None)
-    if asset_name is not None and not asset_name:
+    asset_name = values["TAILWIND_CLI_ASSET_NAME"]
+    if asset_name is not _UNSET and asset_name is not None and not asset_name:
         raise ValueError(
             "TAILWIND_CLI_ASSET_NAME must not be empty. Either remove the setting or provide a valid asset name."
         )
 
     # Validate TAILWIND_CLI_DIST_CSS if set
-    dist_css = getattr(settings, "TAILWIND_CLI_DIST_CSS", None)
-    if dist_css is not None and not dist_css:
+    dist_css = values["TAILWIND_CLI_DIST_CSS"]
+    if dist_css is not _UNSET and dist_css is not None and not dist_css:
         raise ValueError(
             "TAILWIND_CLI_DIST_CSS must not be empty. Either remove the setting or provide a valid CSS path."
         )
 
     # Validate TAILWIND_CLI_SRC_REPO if set
-    src_repo = getattr(settings, "TAILWIND_CLI_SRC_REPO", None)
-    if src_repo is not None and not src_repo:
+    src_repo = values["TAILWIND_CLI_SRC_REPO"]
+    if src_repo is not _UNSET and src_repo is not None and not src_repo:
         raise ValueError(
             "TAILWIND_CLI_SRC_REPO must not be empty. Either remove the setting or provide a valid repository URL."
         )
 
     # Validate system-binary settings
-    _validate_system_binary_settings()
+    _validate_system_binary_settings(values)
 
     # Validate mutual exclusivity of CSS settings
-    _validate_css_settings()
+    _validate_css_settings(values)
 
 
-def _validate_system_binary_settings() -> None:
+def _validate_system_binary_settings(values: dict[str, Any]) -> None:
     """Validate TAILWIND_CLI_USE_SYSTEM_BINARY and friends.
 
+    Args:
+        values: Settings as returned by _load_settings().
+
     Raises:
         ValueError: If configuration is inconsistent or invalid.
     """
-    use_system_binary = getattr(settings, "TAILWIND_CLI_USE_SYSTEM_BINARY", False)
-    binary_name = getattr(settings, "TAILWIND_CLI_SYSTEM_BINARY_NAME", None)
+    use_system_binary = values["TAILWIND_CLI_USE_SYSTEM_BINARY"]
+    binary_name = values["TAILWIND_CLI_SYSTEM_BINARY_NAME"]
 
     if binary_name is not None and not binary_name:
         raise ValueError(
@@ -275,7 +349,7 @@ def _validate_system_binary_settings() -> None:
             "Either remove the setting or provide a valid binary name."
         )
 
-    if use_system_binary and getattr(settings, "TAILWIND_CLI_PATH", None):
+    if use_system_binary and values["TAILWIND_CLI_PATH"]:
         raise ValueError(
             "Cannot use TAILWIND_CLI_USE_SYSTEM_BINARY together with TAILWIND_CLI_PATH. "
             "Choose one: either point TAILWIND_CLI_PATH at a specific binary, or set "
@@ -283,15 +357,18 @@ def _validate_system_binary_settings() -> None:
         )
 
 
-def _validate_css_settings() -> None:
+def _validate_css_settings(values: dict[str, Any]) -> None:
     """Validate CSS configuration settings for mutual exclusivity.
 
+    Args:
+        values: Settings as returned by _load_settings().
+
     Raises:
         ValueError: If both single-file and multi-file configurations are present.
     """
-    has_css_map = hasattr(settings, "TAILWIND_CLI_CSS_MAP") and settings.TAILWIND_CLI_CSS_MAP
-    has_src_css = hasattr(settings, "TAILWIND_CLI_SRC_CSS") and settings.TAILWIND_CLI_SRC_CSS
-    has_dist_css = hasattr(settings, "TAILWIND_CLI_DIST_CSS") and settings.TAILWIND_CLI_DIST_CSS
+    has_css_map = bool(values["TAILWIND_CLI_CSS_MAP"])
+    has_src_css = bool(values["TAILWIND_CLI_SRC_CSS"])
+    has_dist_css = values["TAILWIND_CLI_DIST_CSS"] is not _UNSET and bool(values["TAILWIND_CLI_DIST_CSS"])
 
     if has_css_map and (has_src_css or has_dist_css):
         raise ValueError(
@@ -302,7 +379,7 @@ def _validate_css_settings() -> None:
 
     # Validate CSS_MAP format if provided
     if has_css_map:
-        css_map_raw = settings.TAILWIND_CLI_CSS_MAP
+        css_map_raw = values["TAILWIND_CLI_CSS_MAP"]
         if not isinstance(css_map_raw, (list, tuple)):
             raise ValueError("TAILWIND_CLI_CSS_MAP must be a list or tuple of (source, destination) pairs.")
 
@@ -327,26 +404,44 @@ def _validate_css_settings() -> None:
             names_seen.add(name)
 
 
-def get_platform_info() -> PlatformInfo:
-    """Get platform information for CLI binary selection.
+# platform.machine() spellings mapped to the architecture names used in release assets.
+_MACHINE_ALIASES = {"x86_64": "x64", "amd64": "x64", "aarch64": "arm64"}
+
+
+def _normalize_platform(system: str, machine: str) -> PlatformInfo:
+    """Map ``platform.system()``/``platform.machine()`` values to release asset naming.
+
+    Args:
+        system: Operating system name as reported by ``platform.system()``.
+        machine: Machine type as reported by ``platform.machine()``.
 
     Returns:
         PlatformInfo: Platform details needed for binary selection.
     """
-    system = platform.system().lower()
+    system = system.lower()
     system = "macos" if system == "darwin" else system
 
-    machine = platform.machine().lower()
-    if machine in ["x86_64", "amd64"]:
-        machine = "x64"
-    elif machine == "aarch64":
-        machine = "arm64"
+    machine = machine.lower()
+    machine = _MACHINE_ALIASES.get(machine, machine)
 
     extension = ".exe" if system == "windows" else ""
 
     return PlatformInfo(system=system, machine=machine, extension=extension)
 
 
+@functools.cache
+def get_platform_info() -> PlatformInfo:
+    """Get platform information for CLI binary selection.
+
+    The platform cannot change while the process runs, so the result is
+    memoized; tests that patch ``platform`` call ``get_platform_info.cache_clear()``.
+
+    Returns:
+        PlatformInfo: Platform details needed for binary selection.
+    """
+    return _normalize_platform(platform.system(), platform.machine())
+
+
 def _get_cache_path() -> Path:
     """Get the path for version cache file.
 
@@ -355,65 +450,148 @@ def _get_cache_path() -> Path:
     """
     cache_dir = Path(tempfile.gettempdir()) / ".django-tailwind-cli"
     cache_dir.mkdir(exist_ok=True)
-    return cache_dir / "version_cache.txt"
+    return cache_dir / "version_cache.json"
 
 
-def _load_cached_version(repo_url: str) -> VersionCache | None:
+def _read_version_cache(cache_path: Path) -> dict[str, dict[str, object]]:
+    """Read the version cache file, keyed by repository URL.
+
+    Args:
+        cache_path: Path to the version cache file.
+
+    Returns:
+        dict: Cache entries, empty if the file is missing or unreadable.
+    """
+    try:
+        data = json.loads(cache_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}  # pyright: ignore[reportUnknownVariableType]
+
+
+def _load_cached_version(repo_url: str, *, include_expired: bool = False) -> VersionCache | None:
     """Load cached version information.
 
     Args:
         repo_url: Repository URL to match against cache.
+        include_expired: Also return entries older than the cache TTL, e.g. to revalidate their ETag.
 
     Returns:
         VersionCache if valid cache exists, None otherwise.
     """
-    cache_path = _get_cache_path()
-
-    if not cache_path.exists():
+    entry = _read_version_cache(_get_cache_path()).get(repo_url)
+    if not isinstance(entry, dict):
         return None
 
     try:
-        with cache_path.open("r") as f:
-            lines = f.readlines()
-            if len(lines) >= 3:
-                cached_repo = lines[0].strip()
-                version_str = lines[1].strip()
-                timestamp = float(lines[2].strip())
-
-                # Cache is valid for 1 hour
-                if cached_repo == repo_url and (time.time() - timestamp) < 3600:
-                    return VersionCache(
-                        version_str=version_str, version=Version.parse(version_str), timestamp=timestamp
-                    )
-    except (OSError, ValueError, IndexError):
-        # Ignore cache read errors
+        version_str = str(entry["version"])  # pyright: ignore[reportUnknownArgumentType]
+        timestamp = float(entry["fetched_at"])  # pyright: ignore[reportUnknownArgumentType, reportArgumentType]
+        etag = entry.get("etag")  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+        if include_expired or _is_fresh(timestamp):
+            return VersionCache(
+                version_str=version_str,
+                version=Version.parse(version_str),
+                timestamp=timestamp,
+                etag=etag if isinstance(etag, str) else None,
+            )
+    except (KeyError, TypeError, ValueError):
+        # Ignore malformed cache entries
         pass
 
     return None
 
 
-def _save_cached_version(repo_url: str, version_str: str) -> None:
+def _save_cached_version(repo_url: str, version_str: str, etag: str | None = None) -> float:
     """Save version information to cache.
 
+    The file is rewritten atomically so concurrent management commands never
+    observe a half-written cache.
+
     Args:
         repo_url: Repository URL.
         version_str: Version string to cache.
+        etag: ETag of the release redirect, used to revalidate the entry once it expires.
+
+    Returns:
+        float: The ``fetched_at`` timestamp recorded for the entry.
     """
     cache_path = _get_cache_path()
+    data = _read_version_cache(cache_path)
+    fetched_at = time.time()
+    data[repo_url] = {"version": version_str, "etag": etag, "fetched_at": fetched_at}
 
     try:
-        with cache_path.open("w") as f:
-            f.write(f"{repo_url}\n{version_str}\n{time.time()}\n")
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=".version_cache-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_name, cache_path)
+        except OSError:  # pragma: no cover
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_name)
+            raise
     except OSError:  # pragma: no cover
         # Ignore cache write errors
         pass
+    return fetched_at
+
+
+def _is_fresh(fetched_at: float) -> bool:
+    """Return True while a version fetched at ``fetched_at`` is within the cache TTL."""
+    return 0 <= time.time() - fetched_at < _VERSION_CACHE_TTL
+
 
+@functools.cache
+def _get_latest_version(repo_url: str, timeout: int) -> VersionCache:
+    """Resolve the latest release version of a repository.
+
+    The on-disk cache is consulted before asking GitHub. An expired entry is
+    revalidated with its ETag so an unchanged release costs a bodiless 304.
+    Successful lookups are memoized; callers check the returned timestamp with
+    ``_is_fresh()`` so the in-process result expires together with the on-disk
+    entry. Failures raise and are therefore retried on the next call.
+
+    Args:
+        repo_url: Repository to look up (e.g. "tailwindlabs/tailwindcss").
+        timeout: Request timeout in seconds.
 
-def get_version() -> tuple[str, Version]:
+    Returns:
+        VersionCache: The latest version without the "v" prefix, its parsed form and when it was fetched.
+
+    Raises:
+        http.RequestError: On network errors.
+        ValueError: If GitHub did not redirect to a parseable release tag.
+    """
+    cached = _load_cached_version(repo_url, include_expired=True)
+    if cached and _is_fresh(cached.timestamp):
+        return cached
+
+    from django_tailwind_cli.utils import http
+
+    result = http.fetch_redirect(
+        f"https://github.com/{repo_url}/releases/latest/",
+        timeout=timeout,
+        etag=cached.etag if cached else None,
+    )
+    if result.not_modified and cached:
+        return cached._replace(timestamp=_save_cached_version(repo_url, cached.version_str, cached.etag))
+    if not result.success or not result.location:
+        raise ValueError(f"Could not determine the latest release of {repo_url}.")
+
+    version_str = result.location.rstrip("/").split("/")[-1].replace("v", "")
+    version = Version.parse(version_str)  # Never cache something we cannot parse
+    fetched_at = _save_cached_version(repo_url, version_str, result.etag)
+    return VersionCache(version_str, version, fetched_at, result.etag)
+
+
+def get_version(values: dict[str, Any] | None = None) -> tuple[str, Version]:
     """
     Retrieves the version of Tailwind CSS specified in the Django settings or fetches the latest
     version from the Tailwind CSS GitHub repository.
 
+    Args:
+        values: Settings as returned by _load_settings(). Read from Django settings when omitted.
+
     Returns:
         tuple[str, Version]: A tuple containing the version string and the parsed Version object.
 
@@ -421,47 +599,55 @@ def get_version() -> tuple[str, Version]:
         ValueError: If the TAILWIND_CLI_SRC_REPO setting is None when the version is set to
         "latest".
     """
-    use_daisy_ui = getattr(settings, "TAILWIND_CLI_USE_DAISY_UI", False)
-    version_str = getattr(settings, "TAILWIND_CLI_VERSION", "latest")
-    repo_url = getattr(
-        settings,
-        "TAILWIND_CLI_SRC_REPO",
-        "tailwindlabs/tailwindcss" if not use_daisy_ui else "dobicinaitis/tailwind-cli-extra",
-    )
+    resolved = _resolve_version(_load_settings() if values is None else values)
+    return resolved.version_str, resolved.version
+
+
+def _resolve_version(values: dict[str, Any]) -> _ResolvedVersion:
+    """Resolve the configured version, recording whether it may be memoized.
+
+    Args:
+        values: Settings as returned by _load_settings().
+
+    Returns:
+        _ResolvedVersion: The version, when a "latest" lookup was fetched and whether it fell back.
+
+    Raises:
+        ValueError: If the TAILWIND_CLI_SRC_REPO setting is None when the version is set to
+        "latest".
+    """
+    use_daisy_ui = values["TAILWIND_CLI_USE_DAISY_UI"]
+    version_str = values["TAILWIND_CLI_VERSION"]
+    repo_url = values["TAILWIND_CLI_SRC_REPO"]
+    if repo_url is _UNSET:
+        repo_url = "tailwindlabs/tailwindcss" if not use_daisy_ui else "dobicinaitis/tailwind-cli-extra"
     if not repo_url:
         raise ValueError("TAILWIND_CLI_SRC_REPO must not be None.")
 
     if version_str == "latest":
-        # Try to load from cache first
-        cached = _load_cached_version(repo_url)
-        if cached:
-            return cached.version_str, cached.version
+        # Deferred so pinned versions never load urllib.request and the HTTP stack.
+        from django_tailwind_cli.utils import http
 
-        # Fetch latest version from GitHub
-        timeout = getattr(settings, "TAILWIND_CLI_REQUEST_TIMEOUT", 10)
+        timeout = values["TAILWIND_CLI_REQUEST_TIMEOUT"]
         try:
-            success, location = http.fetch_redirect_location(
-                f"https://github.com/{repo_url}/releases/latest/", timeout=timeout
-            )
-            if success and location:
-                version_str = location.rstrip("/").split("/")[-1].replace("v", "")
-                # Cache the result
-                _save_cached_version(repo_url, version_str)
-                return version_str, Version.parse(version_str)
+            latest = _get_latest_version(repo_url, timeout)
+            if not _is_fresh(latest.timestamp):
+                # Memoized past the on-disk entry's expiry, look it up again
+                _get_latest_version.cache_clear()
+                latest = _get_latest_version(repo_url, timeout)
         except (http.RequestError, ValueError):
-            # Network or parsing error, fall back to cached or default
-            pass
-
-        return FALLBACK_VERSION, Version.parse(FALLBACK_VERSION)
+            # Network or parsing error, fall back to default
+            return _ResolvedVersion(FALLBACK_VERSION, _FALLBACK, is_fallback=True)
+        return _ResolvedVersion(latest.version_str, latest.version, fetched_at=latest.timestamp)
     elif repo_url == "tailwindlabs/tailwindcss":
         version = Version.parse(version_str)
         if version.major < 4:
             raise ValueError(
                 "Tailwind CSS 3.x is not supported by this version. Use version 2.21.1 if you want to use Tailwind 3."
             )
-        return version_str, version
+        return _ResolvedVersion(version_str, version)
     else:
-        return version_str, Version.parse(version_str)
+        return _ResolvedVersion(version_str, Version.parse(version_str))
 
 
 _VERSION_PATTERN = re.compile(r"tailwindcss v(\d+\.\d+\.\d+)")
@@ -532,26 +718,28 @@ def _resolve_system_binary(binary_name: str) -> Path:
     return Path(found)
 
 
-def _get_system_binary_name(*, use_daisy_ui: bool) -> str:
+def _get_system_binary_name(values: dict[str, Any], *, use_daisy_ui: bool) -> str:
     """Return the system binary name to look up via shutil.which.
 
     Args:
+        values: Settings as returned by _load_settings().
         use_daisy_ui: Whether DaisyUI support is enabled.
 
     Returns:
         Binary name — honours the explicit TAILWIND_CLI_SYSTEM_BINARY_NAME
         override if set, otherwise picks a DaisyUI-aware default.
     """
-    override = getattr(settings, "TAILWIND_CLI_SYSTEM_BINARY_NAME", None)
+    override = values["TAILWIND_CLI_SYSTEM_BINARY_NAME"]
     if override:
         return override
     return "tailwindcss-extra" if use_daisy_ui else "tailwindcss"
 
 
-def _resolve_cli_path(platform_info: PlatformInfo, version_str: str, asset_name: str) -> Path:
+def _resolve_cli_path(values: dict[str, Any], platform_info: PlatformInfo, version_str: str, asset_name: str) -> Path:
     """Resolve the CLI executable path.
 
     Args:
+        values: Settings as returned by _load_settings().
         platform_info: Platform information.
         version_str: Version string.
         asset_name: Asset name for the CLI.
@@ -559,20 +747,26 @@ def _resolve_cli_path(platform_info: PlatformInfo, version_str: str, asset_name:
     Returns:
         Path: Resolved path to the CLI executable.
     """
-    cli_path = getattr(settings, "TAILWIND_CLI_PATH", None)
+    cli_path = values["TAILWIND_CLI_PATH"]
     if not cli_path:
         cli_path = ".django_tailwind_cli"
 
-    cli_path = Path(cli_path)
+    cli_path = Path(cli_path).expanduser()
     if not cli_path.is_absolute():
         cli_path = Path(settings.BASE_DIR) / cli_path
 
-    if cli_path.exists() and cli_path.is_file() and os.access(cli_path, os.X_OK):
-        return cli_path.expanduser().resolve()
+    # A single stat answers "exists" and "is a regular file". Whether the current
+    # user may execute it depends on owner and group too, which os.access checks.
+    try:
+        mode = cli_path.stat().st_mode
+    except OSError:
+        mode = 0
+
+    if stat.S_ISREG(mode) and os.access(cli_path, os.X_OK):
+        return cli_path.resolve()
     else:
-        return (
-            cli_path.expanduser()
-            / f"{asset_name}-{platform_info.system}-{platform_info.machine}-{version_str}{platform_info.extension}"
+        return cli_path / (
+            f"{asset_name}-{platform_info.system}-{platform_info.machine}-{version_str}{platform_info.extension}"
         )
 
 
@@ -589,23 +783,27 @@ def _get_staticfile_path() -> str:
     return first_staticfile_dir
 
 
-def _resolve_css_paths() -> tuple[list[CSSEntry], bool]:
+def _resolve_css_paths(values: dict[str, Any]) -> tuple[list[CSSEntry], bool]:
     """Resolve CSS input and output paths.
 
     Supports two configuration modes:
     1. Multi-file mode: TAILWIND_CLI_CSS_MAP = [('admin.css', 'admin.output.css'), ...]
     2. Single-file mode: TAILWIND_CLI_SRC_CSS and TAILWIND_CLI_DIST_CSS
 
+    Args:
+        values: Settings as returned by _load_settings().
+
     Returns:
         tuple: (list of CSSEntry, overwrite_default_config flag)
 
     Raises:
         ValueError: If TAILWIND_CLI_DIST_CSS is None in single-file mode.
     """
-    staticfile_path = _get_staticfile_path()
+    static_root = Path(_get_staticfile_path())
+    base_dir = Path(settings.BASE_DIR)
 
     # Check for multi-file configuration
-    css_map_raw = getattr(settings, "TAILWIND_CLI_CSS_MAP", None)
+    css_map_raw = values["TAILWIND_CLI_CSS_MAP"]
     if css_map_raw:
         # Type assertion after validation in _validate_css_settings()
         css_map: list[tuple[str, str]] = css_map_raw  # pyright: ignore[reportAssignmentType]
@@ -613,9 +811,9 @@ def _resolve_css_paths() -> tuple[list[CSSEntry], bool]:
         for src, dist in css_map:
             src_path = Path(src)
             if not src_path.is_absolute():
-                src_path = Path(settings.BASE_DIR) / src_path
+                src_path = base_dir / src_path
 
-            dist_path = Path(staticfile_path) / dist
+            dist_path = static_root / dist
 
             # Derive name from source filename without extension
             name = Path(src).stem
@@ -633,16 +831,18 @@ def _resolve_css_paths() -> tuple[list[CSSEntry], bool]:
         return entries, False
 
     # Single-file mode (existing behavior)
-    dist_css_base = getattr(settings, "TAILWIND_CLI_DIST_CSS", "css/tailwind.css")
+    dist_css_base = values["TAILWIND_CLI_DIST_CSS"]
+    if dist_css_base is _UNSET:
+        dist_css_base = "css/tailwind.css"
     if not dist_css_base:
         raise ValueError(
             "TAILWIND_CLI_DIST_CSS must not be None. Either remove the setting or provide a valid CSS path."
         )
 
-    dist_css = Path(staticfile_path) / dist_css_base
+    dist_css = static_root / dist_css_base
 
     # Resolve source CSS path
-    src_css = getattr(settings, "TAILWIND_CLI_SRC_CSS", None)
+    src_css = values["TAILWIND_CLI_SRC_CSS"]
     if not src_css:
         src_css = ".django_tailwind_cli/source.css"
         overwrite_default_config = True
@@ -651,7 +851,7 @@ def _resolve_css_paths() -> tuple[list[CSSEntry], bool]:
 
     src_css = Path(src_css)
     if not src_css.is_absolute():
-        src_css = Path(settings.BASE_DIR) / src_css
+        src_css = base_dir / src_css
 
     # Create single entry with default name
     entry = CSSEntry(
@@ -664,10 +864,11 @@ def _resolve_css_paths() -> tuple[list[CSSEntry], bool]:
     return [entry], overwrite_default_config
 
 
-def _get_repository_settings(*, use_daisy_ui: bool) -> tuple[str, str]:
+def _get_repository_settings(values: dict[str, Any], *, use_daisy_ui: bool) -> tuple[str, str]:
     """Get repository URL and asset name based on DaisyUI setting.
 
     Args:
+        values: Settings as returned by _load_settings().
         use_daisy_ui: Whether DaisyUI support is enabled.
 
     Returns:
@@ -683,8 +884,12 @@ def _get_repository_settings(*, use_daisy_ui: bool) -> tuple[str, str]:
         default_repo = "tailwindlabs/tailwindcss"
         default_asset = "tailwindcss"
 
-    repo_url = getattr(settings, "TAILWIND_CLI_SRC_REPO", default_repo)
-    asset_name = getattr(settings, "TAILWIND_CLI_ASSET_NAME", default_asset)
+    repo_url = values["TAILWIND_CLI_SRC_REPO"]
+    if repo_url is _UNSET:
+        repo_url = default_repo
+    asset_name = values["TAILWIND_CLI_ASSET_NAME"]
+    if asset_name is _UNSET:
+        asset_name = default_asset
 
     # Validate asset name
     if not asset_name:
@@ -698,41 +903,73 @@ def _get_repository_settings(*, use_daisy_ui: bool) -> tuple[str, str]:
 def get_config() -> Config:
     """Get Tailwind CLI configuration.
 
+    The configuration is memoized. With a "latest" version it is rebuilt once
+    the version cache entry it was built from expires, so a new release is
+    picked up as it changes. A configuration that had to fall back to
+    ``FALLBACK_VERSION`` because the latest release could not be determined is
+    never kept. The cache is also dropped whenever a relevant setting changes
+    through Django's ``setting_changed`` signal (``override_settings``,
+    pytest-django's ``settings`` fixture); call ``_build_config.cache_clear()``
+    to reset it manually.
+
     Returns:
         Config: Complete configuration object.
 
     Raises:
         ValueError: If required settings are missing or invalid.
     """
+    config = _build_config()
+    if config.version_fetched_at is not None and not _is_fresh(config.version_fetched_at):
+        _build_config.cache_clear()
+        config = _build_config()
+    if config.is_fallback_version:
+        _build_config.cache_clear()
+    return config
+
+
+@functools.cache
+def _build_config() -> Config:
+    """Build the configuration behind get_config().
+
+    Returns:
+        Config: Complete configuration object.
+
+    Raises:
+        ValueError: If required settings are missing or invalid.
+    """
+    # Read all settings once
+    values = _load_settings()
+
     # Validate required settings
-    _validate_required_settings()
+    _validate_required_settings(values)
 
     # Get basic settings
-    use_daisy_ui = getattr(settings, "TAILWIND_CLI_USE_DAISY_UI", False)
-    automatic_download = getattr(settings, "TAILWIND_CLI_AUTOMATIC_DOWNLOAD", True)
-    uses_system_binary = bool(getattr(settings, "TAILWIND_CLI_USE_SYSTEM_BINARY", False))
-    auto_source_external_apps = bool(getattr(settings, "TAILWIND_CLI_AUTO_SOURCE_EXTERNAL_APPS", False))
+    use_daisy_ui = values["TAILWIND_CLI_USE_DAISY_UI"]
+    automatic_download = values["TAILWIND_CLI_AUTOMATIC_DOWNLOAD"]
+    uses_system_binary = bool(values["TAILWIND_CLI_USE_SYSTEM_BINARY"])
+    auto_source_external_apps = bool(values["TAILWIND_CLI_AUTO_SOURCE_EXTERNAL_APPS"])
 
     # Get platform information
     platform_info = get_platform_info()
 
     # Get version information
-    version_str, version = get_version()
+    resolved = _resolve_version(values)
+    version_str = resolved.version_str
 
     # Get repository and asset settings
-    repo_url, asset_name = _get_repository_settings(use_daisy_ui=use_daisy_ui)
+    repo_url, asset_name = _get_repository_settings(values, use_daisy_ui=use_daisy_ui)
 
     # Resolve paths
     if uses_system_binary:
-        binary_name = _get_system_binary_name(use_daisy_ui=use_daisy_ui)
+        binary_name = _get_system_binary_name(values, use_daisy_ui=use_daisy_ui)
         cli_path = _resolve_system_binary(binary_name)
         # System binary mode implies auto-download is off — we never downloaded it.
         automatic_download = False
-        _maybe_warn_version_mismatch(cli_path, version_str)
+        _maybe_warn_version_mismatch(cli_path, version_str, values["TAILWIND_CLI_VERSION"])
     else:
-        cli_path = _resolve_cli_path(platform_info, version_str, asset_name)
+        cli_path = _resolve_cli_path(values, platform_info, version_str, asset_name)
 
-    css_entries, overwrite_default_config = _resolve_css_paths()
+    css_entries, overwrite_default_config = _resolve_css_paths(values)
 
     # Build download URL
     download_url = (
@@ -742,19 +979,30 @@ def get_config() -> Config:
 
     return Config(
         version_str=version_str,
-        version=version,
+        version=resolved.version,
         cli_path=cli_path,
         download_url=download_url,
-        css_entries=css_entries,
+        css_entries=tuple(css_entries),
         overwrite_default_config=overwrite_default_config,
         automatic_download=automatic_download,
         use_daisy_ui=use_daisy_ui,
         uses_system_binary=uses_system_binary,
         auto_source_external_apps=auto_source_external_apps,
+        version_fetched_at=resolved.fetched_at,
+        is_fallback_version=resolved.is_fallback,
     )
 
 
-def _maybe_warn_version_mismatch(cli_path: Path, configured_version: str) -> None:
+def _clear_config_cache(*, setting: str, **_kwargs: Any) -> None:
+    """Drop the memoized configuration when a setting it depends on changes."""
+    if setting.startswith("TAILWIND_CLI_") or setting in ("BASE_DIR", "STATICFILES_DIRS"):
+        _build_config.cache_clear()
+
+
+setting_changed.connect(_clear_config_cache)
+
+
+def _maybe_warn_version_mismatch(cli_path: Path, configured_version: str, version_setting: str) -> None:
     """Warn when the system binary reports a different version than configured.
 
     No warning is emitted when:
@@ -765,9 +1013,10 @@ def _maybe_warn_version_mismatch(cli_path: Path, configured_version: str) -> Non
     Args:
         cli_path: Path to the system binary.
         configured_version: Version string as resolved by get_version().
+        version_setting: Raw TAILWIND_CLI_VERSION value.
     """
     # When the user set VERSION='latest', they accepted whatever is installed.
-    if getattr(settings, "TAILWIND_CLI_VERSION", "latest") == "latest":
+    if version_setting == "latest":
         return
 
     detected = detect_binary_version(cli_path)
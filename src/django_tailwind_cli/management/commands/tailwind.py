@@ -12,9 +12,8 @@ import time
 from pathlib import Path
 from types import FrameType
 from typing import IO, Any
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 
-from django_tailwind_cli.utils import http
 import typer
 from django.conf import settings
 from django.core.management.base import CommandError
@@ -94,6 +93,15 @@ def _drain_filtered_stderr(stream: IO[str], is_shutting_down: Callable[[], bool]
 # DECORATORS AND COMMON SETUP ---------------------------------------------------------------------
 
 
+def _emit_block(lines: Iterable[tuple[str, str]]) -> None:
+    """Write several styled lines with a single echo call.
+
+    Args:
+        lines: Pairs of (text, foreground color).
+    """
+    typer.echo("\n".join(typer.style(text, fg=color) for text, color in lines))
+
+
 def handle_command_errors(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to handle common command errors consistently.
 
@@ -273,15 +281,21 @@ def build(
     )
 
     if verbose:
-        typer.secho("🏗️  Starting Tailwind CSS build process...", fg=typer.colors.CYAN)
-        typer.secho(f"   • CSS entries: {len(config.css_entries)}", fg=typer.colors.BLUE)
-        for entry in config.css_entries:
-            typer.secho(f"   • [{entry.name}] {entry.src_css} -> {entry.dist_css}", fg=typer.colors.BLUE)
-        typer.secho(f"   • CLI Path: {config.cli_path}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Version: {config.version_str}", fg=typer.colors.BLUE)
-        typer.secho(f"   • DaisyUI: {'enabled' if config.use_daisy_ui else 'disabled'}", fg=typer.colors.BLUE)
+        _emit_block(
+            [
+                ("🏗️  Starting Tailwind CSS build process...", typer.colors.CYAN),
+                (f"   • CSS entries: {len(config.css_entries)}", typer.colors.BLUE),
+                *(
+                    (f"   • [{entry.name}] {entry.src_css} -> {entry.dist_css}", typer.colors.BLUE)
+                    for entry in config.css_entries
+                ),
+                (f"   • CLI Path: {config.cli_path}", typer.colors.BLUE),
+                (f"   • Version: {config.version_str}", typer.colors.BLUE),
+                (f"   • DaisyUI: {'enabled' if config.use_daisy_ui else 'disabled'}", typer.colors.BLUE),
+            ]
+        )
 
-    _setup_tailwind_environment_with_verbose(verbose=verbose)
+    _setup_tailwind_environment_with_verbose(config, verbose=verbose)
 
     # Build each CSS entry
     entries_built = 0
@@ -289,16 +303,16 @@ def build(
 
     for entry in config.css_entries:
         # Check if rebuild is necessary (unless forced)
-        if not force and not _should_rebuild_css(entry.src_css, entry.dist_css):
-            entries_skipped += 1
-            if verbose:
-                typer.secho(f"⏭️  [{entry.name}] Build skipped: output is up-to-date", fg=typer.colors.YELLOW)
-                if entry.src_css.exists() and entry.dist_css.exists():
-                    src_mtime = entry.src_css.stat().st_mtime
-                    dist_mtime = entry.dist_css.stat().st_mtime
-                    typer.secho(f"   • Source modified: {time.ctime(src_mtime)}", fg=typer.colors.BLUE)
-                    typer.secho(f"   • Output modified: {time.ctime(dist_mtime)}", fg=typer.colors.BLUE)
-            continue
+        if not force:
+            src_stat, dist_stat = _stat_pair(entry.src_css, entry.dist_css)
+            if not _should_rebuild_css(src_stat, dist_stat):
+                entries_skipped += 1
+                if verbose:
+                    typer.secho(f"⏭️  [{entry.name}] Build skipped: output is up-to-date", fg=typer.colors.YELLOW)
+                    if src_stat is not None and dist_stat is not None:
+                        typer.secho(f"   • Source modified: {time.ctime(src_stat.st_mtime)}", fg=typer.colors.BLUE)
+                        typer.secho(f"   • Output modified: {time.ctime(dist_stat.st_mtime)}", fg=typer.colors.BLUE)
+                continue
 
         if verbose:
             build_cmd = config.get_build_cmd(entry, minify=effective_minify)
@@ -408,25 +422,33 @@ def _run_watch_loop(*, verbose: bool = False) -> None:
     config = get_config()
 
     if verbose:
-        typer.secho("👀 Starting Tailwind CSS watch mode...", fg=typer.colors.CYAN)
-        typer.secho(f"   • CSS entries: {len(config.css_entries)}", fg=typer.colors.BLUE)
-        for entry in config.css_entries:
-            typer.secho(f"   • [{entry.name}] {entry.src_css} -> {entry.dist_css}", fg=typer.colors.BLUE)
-        typer.secho(f"   • CLI Path: {config.cli_path}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Version: {config.version_str}", fg=typer.colors.BLUE)
+        _emit_block(
+            [
+                ("👀 Starting Tailwind CSS watch mode...", typer.colors.CYAN),
+                (f"   • CSS entries: {len(config.css_entries)}", typer.colors.BLUE),
+                *(
+                    (f"   • [{entry.name}] {entry.src_css} -> {entry.dist_css}", typer.colors.BLUE)
+                    for entry in config.css_entries
+                ),
+                (f"   • CLI Path: {config.cli_path}", typer.colors.BLUE),
+                (f"   • Version: {config.version_str}", typer.colors.BLUE),
+            ]
+        )
 
-    _setup_tailwind_environment_with_verbose(verbose=verbose)
+    _setup_tailwind_environment_with_verbose(config, verbose=verbose)
 
     if verbose:
         typer.secho("🔄 Starting file watcher...", fg=typer.colors.CYAN)
 
     if len(config.css_entries) == 1:
-        # Single entry - use existing simple approach
+        # Single entry - run the watcher in the foreground. Output is inherited
+        # rather than captured: a watch session runs for hours, and capturing
+        # would hide rebuild progress and buffer all of it in memory until exit.
         _execute_tailwind_command(
             config.watch_cmd,
             success_message="Stopped watching for changes.",
             error_message="Failed to start in watch mode",
-            capture_output=True,
+            capture_output=False,
             verbose=verbose,
         )
     else:
@@ -1054,11 +1076,7 @@ def runserver(
         python manage.py runserver --help
         python manage.py runserver_plus --help   (with django-extensions)
     """
-    use_plus = (
-        importlib.util.find_spec("django_extensions")
-        and importlib.util.find_spec("werkzeug")
-        and not force_default_runserver
-    )
+    use_plus = _has_runserver_plus() and not force_default_runserver
     server_command = "runserver_plus" if use_plus else "runserver"
 
     watch_cmd = [sys.executable, "manage.py", "tailwind", "watch"]
@@ -1068,9 +1086,47 @@ def runserver(
     process_manager.start_concurrent_processes(watch_cmd, server_cmd)
 
 
+@functools.cache
+def _has_runserver_plus() -> bool:
+    """Return whether django-extensions' runserver_plus and its werkzeug dependency are importable.
+
+    find_spec() probes every sys.path entry, and the answer cannot change for
+    the life of the process, so it is looked up once.
+    """
+    return (
+        importlib.util.find_spec("django_extensions") is not None and importlib.util.find_spec("werkzeug") is not None
+    )
+
+
 # PROCESS MANAGEMENT FUNCTIONS -------------------------------------------------------------------
 
 
+# Whatever signal.signal() returns: a callable, SIG_DFL/SIG_IGN, or None.
+_SignalHandler = Callable[[int, FrameType | None], Any] | int | signal.Handlers | None
+
+
+def _install_sigterm_handler(handler: Callable[[int, FrameType | None], None]) -> _SignalHandler:
+    """Route SIGTERM to ``handler`` and return the handler it replaced.
+
+    Only the main thread may install handlers — signal.signal() raises
+    ValueError in worker threads (e.g. under Django's autoreloader) — so
+    elsewhere this does nothing and returns None.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return None
+    return signal.signal(signal.SIGTERM, handler)
+
+
+def _restore_sigterm_handler(previous: _SignalHandler) -> None:
+    """Reinstall the SIGTERM handler saved by :func:`_install_sigterm_handler`.
+
+    None means nothing was installed, or the previous handler was not set from
+    Python and cannot be restored.
+    """
+    if previous is not None:
+        signal.signal(signal.SIGTERM, previous)
+
+
 class ProcessManager:
     """Manages concurrent processes for Tailwind watch and Django runserver."""
 
@@ -1079,6 +1135,8 @@ class ProcessManager:
     def __init__(self) -> None:
         self.processes: list[subprocess.Popen[str]] = []
         self.shutdown_requested = False
+        # Set whenever a child exits or shutdown is requested; wakes _monitor_processes.
+        self._wakeup = threading.Event()
 
     def start_concurrent_processes(self, watch_cmd: list[str], server_cmd: list[str]) -> None:
         """Start watch and server processes concurrently with proper cleanup.
@@ -1088,11 +1146,11 @@ class ProcessManager:
             server_cmd: Command to start Django development server.
         """
         # SIGINT propagates as KeyboardInterrupt via Python's default handler.
-        # Override SIGTERM only on the main thread — signal.signal() raises
-        # ValueError in worker threads (e.g. under Django's autoreloader).
-        if threading.current_thread() is threading.main_thread():
-            signal.signal(signal.SIGTERM, self._signal_handler)
+        # SIGTERM is routed to us for the lifetime of the processes, then handed
+        # back so a host that installed its own handler gets it back.
+        previous_sigterm = _install_sigterm_handler(self._signal_handler)
 
+        cwd = settings.BASE_DIR
         try:
             # Start Tailwind watch process — inherit stdout/stderr so the
             # user sees watch output live and we avoid a pipe-fill deadlock:
@@ -1100,19 +1158,17 @@ class ProcessManager:
             # after a few minutes of rebuilds and block the watcher.
             watch_process = subprocess.Popen(
                 watch_cmd,
-                cwd=settings.BASE_DIR,
+                cwd=cwd,
                 text=True,
             )
             self.processes.append(watch_process)
             typer.secho("Started Tailwind CSS watch process", fg=typer.colors.GREEN)
 
-            # Give Tailwind a moment to start
-            time.sleep(1)
-
-            # Start Django development server
+            # Start Django development server right away: it is independent of
+            # the watcher and does not need the first build to have finished.
             server_process = subprocess.Popen(
                 server_cmd,
-                cwd=settings.BASE_DIR,
+                cwd=cwd,
                 text=True,
             )
             self.processes.append(server_process)
@@ -1126,6 +1182,7 @@ class ProcessManager:
             raise
         finally:
             self._cleanup_processes()
+            _restore_sigterm_handler(previous_sigterm)
 
     def _signal_handler(self, _signum: int, _frame: FrameType | None) -> None:
         """Adapter for signal.signal — delegates to the idempotent shutdown request."""
@@ -1140,11 +1197,27 @@ class ProcessManager:
             return
         typer.secho(self._SHUTDOWN_MESSAGE, fg=typer.colors.YELLOW)
         self.shutdown_requested = True
+        self._wakeup.set()
+
+    def _wait_for_exit(self, process: subprocess.Popen[str]) -> None:
+        """Block until ``process`` exits, then wake the monitor loop."""
+        process.wait()
+        self._wakeup.set()
 
     def _monitor_processes(self) -> None:
-        """Monitor running processes. Cleanup is owned by start_concurrent_processes' finally."""
+        """Monitor running processes. Cleanup is owned by start_concurrent_processes' finally.
+
+        Sleeps until a child exits or shutdown is requested instead of polling.
+        One daemon thread per child blocks in wait() and sets the wakeup event.
+        On Windows, where the event wait cannot be interrupted, Ctrl+C is also
+        delivered to the children, whose exit wakes the loop.
+        """
+        for process in self.processes:
+            threading.Thread(target=self._wait_for_exit, args=(process,), daemon=True).start()
+
         while not self.shutdown_requested and any(p.poll() is None for p in self.processes):
-            time.sleep(0.5)
+            self._wakeup.wait()
+            self._wakeup.clear()
 
             # Check if any process has exited unexpectedly
             for process in self.processes:
@@ -1181,6 +1254,8 @@ class MultiWatchProcessManager:
     def __init__(self) -> None:
         self.processes: list[subprocess.Popen[str]] = []
         self.shutdown_requested = False
+        # Set whenever a child exits or shutdown is requested; wakes _monitor_processes.
+        self._wakeup = threading.Event()
 
     def start_watch_processes(self, config: Config, *, verbose: bool = False) -> None:
         """Start watch processes for all CSS entries.
@@ -1190,11 +1265,11 @@ class MultiWatchProcessManager:
             verbose: Whether to show detailed information.
         """
         # SIGINT propagates as KeyboardInterrupt via Python's default handler.
-        # Override SIGTERM only on the main thread — signal.signal() raises
-        # ValueError in worker threads (e.g. under Django's autoreloader).
-        if threading.current_thread() is threading.main_thread():
-            signal.signal(signal.SIGTERM, self._signal_handler)
+        # SIGTERM is routed to us for the lifetime of the processes, then handed
+        # back so a host that installed its own handler gets it back.
+        previous_sigterm = _install_sigterm_handler(self._signal_handler)
 
+        cwd = settings.BASE_DIR
         try:
             for index, entry in enumerate(config.css_entries):
                 if index > 0:
@@ -1213,7 +1288,7 @@ class MultiWatchProcessManager:
                 # up easily.
                 process = subprocess.Popen(
                     watch_cmd,
-                    cwd=settings.BASE_DIR,
+                    cwd=cwd,
                     text=True,
                     stderr=subprocess.PIPE,
                 )
@@ -1234,6 +1309,7 @@ class MultiWatchProcessManager:
             raise
         finally:
             self._cleanup_processes()
+            _restore_sigterm_handler(previous_sigterm)
 
     def _signal_handler(self, _signum: int, _frame: FrameType | None) -> None:
         """Adapter for signal.signal — delegates to the idempotent shutdown request."""
@@ -1248,11 +1324,26 @@ class MultiWatchProcessManager:
             return
         typer.secho(self._SHUTDOWN_MESSAGE, fg=typer.colors.YELLOW)
         self.shutdown_requested = True
+        self._wakeup.set()
+
+    def _wait_for_exit(self, process: subprocess.Popen[str]) -> None:
+        """Block until ``process`` exits, then wake the monitor loop."""
+        process.wait()
+        self._wakeup.set()
 
     def _monitor_processes(self) -> None:
-        """Monitor all watch processes. Cleanup is owned by start_watch_processes' finally."""
+        """Monitor all watch processes. Cleanup is owned by start_watch_processes' finally.
+
+        Event-driven like ProcessManager._monitor_processes: one daemon thread
+        per watcher blocks in wait(), so the loop only wakes when a watcher
+        exits or shutdown is requested.
+        """
+        for process in self.processes:
+            threading.Thread(target=self._wait_for_exit, args=(process,), daemon=True).start()
+
         while not self.shutdown_requested and any(p.poll() is None for p in self.processes):
-            time.sleep(0.5)
+            self._wakeup.wait()
+            self._wakeup.clear()
 
             for i, process in enumerate(self.processes):
                 if process.poll() is not None and process.returncode != 0:
@@ -1277,24 +1368,30 @@ class MultiWatchProcessManager:
         typer.secho("Stopped watching for changes.", fg=typer.colors.GREEN)
 
 
-def _download_cli_with_progress(url: str, filepath: Path) -> None:
+def _download_cli_with_progress(url: str, filepath: Path, *, resume: bool = True) -> None:
     """Download CLI with progress indication.
 
     Args:
         url: Download URL.
         filepath: Destination file path.
+        resume: Continue an interrupted earlier download instead of starting over.
     """
-    last_progress = 0
+    # Deferred so commands that never download don't load urllib.request and the HTTP stack.
+    from django_tailwind_cli.utils import http
+
+    next_report = 10.0
 
     def progress_callback(downloaded: int, total_size: int, progress: float) -> None:
-        nonlocal last_progress
+        nonlocal next_report
         # Show progress every 10%
-        if total_size > 0 and int(progress / 10) > int(last_progress / 10):
+        if progress >= next_report:
             typer.secho(f"Progress: {progress:.1f}% ({downloaded}/{total_size} bytes)", fg=typer.colors.CYAN)
-            last_progress = progress
+            next_report = (progress // 10 + 1) * 10
 
     try:
         typer.secho("Downloading Tailwind CSS CLI...", fg=typer.colors.YELLOW)
+        if not resume:
+            http.discard_partial_download(filepath)
         http.download_with_progress(url, filepath, timeout=30, progress_callback=progress_callback)
         typer.secho("Download completed!", fg=typer.colors.GREEN)
 
@@ -1302,12 +1399,19 @@ def _download_cli_with_progress(url: str, filepath: Path) -> None:
         raise CommandError(f"Failed to download Tailwind CSS CLI: {e}") from e
 
 
-def _setup_tailwind_environment_with_verbose(*, verbose: bool = False) -> None:
-    """Common setup for all Tailwind commands with verbose logging."""
+def _setup_tailwind_environment_with_verbose(config: Config | None = None, *, verbose: bool = False) -> None:
+    """Common setup for all Tailwind commands with verbose logging.
+
+    Args:
+        config: Configuration resolved by the calling command; looked up when omitted.
+        verbose: Whether to show detailed setup information.
+    """
+    if config is None:
+        config = get_config()
     if verbose:
         typer.secho("⚙️  Setting up Tailwind environment...", fg=typer.colors.CYAN)
-    _download_cli_with_verbose(verbose=verbose)
-    _create_standard_config_with_verbose(verbose=verbose)
+    _download_cli_with_verbose(config, verbose=verbose)
+    _create_standard_config_with_verbose(config, verbose=verbose)
     _ensure_default_gitignore()
 
 
@@ -1333,33 +1437,45 @@ def _ensure_default_gitignore() -> None:
     gitignore.write_text("*\n")
 
 
-def _should_rebuild_css(src_css: Path, dist_css: Path) -> bool:
-    """Check if CSS should be rebuilt based on file modification times.
+def _stat_pair(src_css: Path, dist_css: Path) -> tuple[os.stat_result | None, os.stat_result | None]:
+    """Stat the source and output CSS files once each.
 
     Args:
         src_css: Source CSS file path.
         dist_css: Distribution CSS file path.
 
     Returns:
-        True if CSS should be rebuilt.
+        Tuple of (source stat, output stat); an entry is None if the file cannot be stat'ed.
     """
-    if not dist_css.exists():
-        return True
+    stats: list[os.stat_result | None] = []
+    for path in (src_css, dist_css):
+        try:
+            stats.append(path.stat())
+        except OSError:
+            stats.append(None)
+    return stats[0], stats[1]
 
-    if not src_css.exists():
-        return True
 
-    try:
-        src_mtime = src_css.stat().st_mtime
-        dist_mtime = dist_css.stat().st_mtime
-        return src_mtime > dist_mtime
-    except OSError:
-        # If we can't get modification times, rebuild to be safe
+def _should_rebuild_css(src_stat: os.stat_result | None, dist_stat: os.stat_result | None) -> bool:
+    """Check if CSS should be rebuilt based on file modification times.
+
+    Args:
+        src_stat: Stat result of the source CSS file, as returned by _stat_pair().
+        dist_stat: Stat result of the distribution CSS file, as returned by _stat_pair().
+
+    Returns:
+        True if CSS should be rebuilt.
+    """
+    if src_stat is None or dist_stat is None:
+        # Missing file or unknown modification time, rebuild to be safe
         return True
 
+    # Integer nanoseconds: exact on high-resolution filesystems, no float rounding
+    return src_stat.st_mtime_ns > dist_stat.st_mtime_ns
+
 
 def _execute_tailwind_command(
-    cmd: list[str],
+    cmd: Sequence[str],
     *,
     success_message: str,
     error_message: str,
@@ -1372,24 +1488,38 @@ def _execute_tailwind_command(
         cmd: Command to execute.
         success_message: Message to display on success.
         error_message: Message prefix for errors.
-        capture_output: Whether to capture subprocess output.
+        capture_output: Whether to capture subprocess output. stderr is captured for error
+            reporting; stdout only in verbose mode, where it is displayed.
         verbose: Whether to show detailed execution information.
     """
+    cwd = settings.BASE_DIR
     try:
         if verbose:
-            typer.secho(f"🚀 Executing: {' '.join(cmd)}", fg=typer.colors.CYAN)
-            typer.secho(f"   • Working directory: {settings.BASE_DIR}", fg=typer.colors.BLUE)
-            typer.secho(f"   • Capture output: {capture_output}", fg=typer.colors.BLUE)
+            _emit_block(
+                [
+                    (f"🚀 Executing: {' '.join(cmd)}", typer.colors.CYAN),
+                    (f"   • Working directory: {cwd}", typer.colors.BLUE),
+                    (f"   • Capture output: {capture_output}", typer.colors.BLUE),
+                ]
+            )
 
         start_time = time.time()
 
         if capture_output:
-            result = subprocess.run(cmd, cwd=settings.BASE_DIR, check=True, capture_output=True, text=True)
+            # stderr is kept for the error message; stdout is only ever shown in verbose mode
+            result = subprocess.run(
+                cmd,
+                cwd=cwd,
+                check=True,
+                stdout=subprocess.PIPE if verbose else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
             if verbose and result.stdout:
                 typer.secho("📤 Command output:", fg=typer.colors.BLUE)
                 typer.echo(result.stdout)
         else:
-            subprocess.run(cmd, cwd=settings.BASE_DIR, check=True)
+            subprocess.run(cmd, cwd=cwd, check=True)
 
         if verbose:
             end_time = time.time()
@@ -1422,29 +1552,25 @@ def _execute_tailwind_command(
 # FILE OPERATION OPTIMIZATIONS --------------------------------------------------------------------
 
 
-def _should_recreate_file(file_path: Path, content: str) -> bool:
-    """Check if a file needs to be recreated based on content and modification time.
+def _should_recreate_file(file_path: Path, content: bytes) -> bool:
+    """Check if a file needs to be recreated based on its size and content.
 
     Args:
         file_path: Path to the file to check.
-        content: New content that would be written.
+        content: New (encoded) content that would be written.
 
     Returns:
         True if file should be recreated, False if it's up to date.
     """
-    if not file_path.exists():
-        return True
-
     try:
-        current_content = file_path.read_text()
-        if current_content != content:
+        # A size mismatch settles it without reading the file
+        if file_path.stat().st_size != len(content):
             return True
-    except (OSError, UnicodeDecodeError):
-        # If we can't read the file, recreate it
+        return file_path.read_bytes() != content
+    except OSError:
+        # Missing or unreadable file, recreate it
         return True
 
-    return False
-
 
 def _is_cli_up_to_date(cli_path: Path, _expected_version: str) -> bool:
     """Check if CLI binary is up to date and functional.
@@ -1456,11 +1582,14 @@ def _is_cli_up_to_date(cli_path: Path, _expected_version: str) -> bool:
     Returns:
         True if CLI is up to date and functional.
     """
-    if not cli_path.exists():
+    # Cheap execute-bit test first; os.access then checks the bits that apply to
+    # the current user, since a file executable only by its owner is no use to others
+    try:
+        mode = cli_path.stat().st_mode
+    except OSError:
         return False
 
-    # Check if CLI is executable
-    if not os.access(cli_path, os.X_OK):
+    if not mode & 0o111 or not os.access(cli_path, os.X_OK):
         return False
 
     # For now, we assume existing CLI is functional
@@ -1468,13 +1597,42 @@ def _is_cli_up_to_date(cli_path: Path, _expected_version: str) -> bool:
     return True
 
 
-# Global cache for file existence checks
-_FILE_CACHE: dict[str, tuple[float, bool]] = {}
+def _prewarm_cli(cli_path: Path) -> None:
+    """Ask the OS to start reading the CLI binary into the page cache.
+
+    The binary is tens of MB and is executed right after setup, so on a cold
+    cache the first build otherwise stalls on demand paging. The hint is
+    asynchronous and best-effort: a no-op where posix_fadvise is unavailable
+    (Windows, macOS) or the file cannot be opened.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(cli_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@functools.lru_cache(maxsize=256)
+def _exists_bucketed(path_str: str, _cache_duration: float, _bucket: int) -> bool:
+    """Return whether ``path_str`` exists; memoized per path, bucket duration and time bucket."""
+    return Path(path_str).exists()
 
 
 def _check_file_exists_cached(file_path: Path, cache_duration: float = 5.0) -> bool:
     """Check file existence with caching to avoid repeated filesystem calls.
 
+    Results are kept in a bounded LRU cache keyed by path, cache duration and a
+    monotonic time bucket, so entries expire once the bucket rolls over and old
+    paths are evicted. The duration is part of the key because bucket numbers
+    of different durations cover different time windows.
+
     Args:
         file_path: Path to check.
         cache_duration: Cache duration in seconds.
@@ -1482,20 +1640,7 @@ def _check_file_exists_cached(file_path: Path, cache_duration: float = 5.0) -> b
     Returns:
         True if file exists (from cache or filesystem).
     """
-    global _FILE_CACHE
-    cache_key = str(file_path)
-    current_time = time.time()
-
-    # Check cache
-    if cache_key in _FILE_CACHE:
-        last_check, existed = _FILE_CACHE[cache_key]
-        if current_time - last_check < cache_duration:
-            return existed
-
-    # Check filesystem and update cache
-    exists = file_path.exists()
-    _FILE_CACHE[cache_key] = (current_time, exists)
-    return exists
+    return _exists_bucketed(str(file_path), cache_duration, int(time.monotonic() // cache_duration))
 
 
 # UTILITY FUNCTIONS -------------------------------------------------------------------------------
@@ -1506,16 +1651,22 @@ def _download_cli(*, force_download: bool = False) -> None:
     _download_cli_with_verbose(verbose=False, force_download=force_download)
 
 
-def _download_cli_with_verbose(*, verbose: bool = False, force_download: bool = False) -> None:
+def _download_cli_with_verbose(
+    config: Config | None = None, *, verbose: bool = False, force_download: bool = False
+) -> None:
     """Assure that the CLI is loaded with optional verbose logging."""
-    c = get_config()
+    c = config if config is not None else get_config()
 
     if verbose:
-        typer.secho("🔍 Checking Tailwind CSS CLI availability...", fg=typer.colors.CYAN)
-        typer.secho(f"   • CLI Path: {c.cli_path}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Version: {c.version_str}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Download URL: {c.download_url}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Automatic download: {c.automatic_download}", fg=typer.colors.BLUE)
+        _emit_block(
+            [
+                ("🔍 Checking Tailwind CSS CLI availability...", typer.colors.CYAN),
+                (f"   • CLI Path: {c.cli_path}", typer.colors.BLUE),
+                (f"   • Version: {c.version_str}", typer.colors.BLUE),
+                (f"   • Download URL: {c.download_url}", typer.colors.BLUE),
+                (f"   • Automatic download: {c.automatic_download}", typer.colors.BLUE),
+            ]
+        )
 
     # System-binary mode: the CLI lives on PATH, never download it.
     if c.uses_system_binary:
@@ -1540,6 +1691,7 @@ def _download_cli_with_verbose(*, verbose: bool = False, force_download: bool =
 
     # Use optimized CLI check for existing installations
     if not force_download and _is_cli_up_to_date(c.cli_path, c.version_str):
+        _prewarm_cli(c.cli_path)
         if verbose:
             typer.secho("✅ CLI is up-to-date and functional", fg=typer.colors.GREEN)
         typer.secho(
@@ -1555,7 +1707,8 @@ def _download_cli_with_verbose(*, verbose: bool = False, force_download: bool =
     typer.secho(f"Downloading Tailwind CSS CLI from '{c.download_url}'.", fg=typer.colors.YELLOW)
 
     # Download with progress indication
-    _download_cli_with_progress(c.download_url, c.cli_path)
+    # A forced download must not build on a partial file left by an earlier attempt
+    _download_cli_with_progress(c.download_url, c.cli_path, resume=not force_download)
 
     # Make CLI executable
     c.cli_path.chmod(0o755)
@@ -1656,15 +1809,19 @@ def _build_source_css_content(*, use_daisy_ui: bool, inject_external_apps: bool)
     return "\n".join(lines) + "\n"
 
 
-def _create_standard_config_with_verbose(*, verbose: bool = False) -> None:
+def _create_standard_config_with_verbose(config: Config | None = None, *, verbose: bool = False) -> None:
     """Create a standard Tailwind CSS config file with optional verbose logging."""
-    c = get_config()
+    c = config if config is not None else get_config()
 
     if verbose:
-        typer.secho("📄 Checking Tailwind CSS source configuration...", fg=typer.colors.CYAN)
-        typer.secho(f"   • Source CSS path: {c.src_css}", fg=typer.colors.BLUE)
-        typer.secho(f"   • Overwrite default: {c.overwrite_default_config}", fg=typer.colors.BLUE)
-        typer.secho(f"   • DaisyUI enabled: {c.use_daisy_ui}", fg=typer.colors.BLUE)
+        _emit_block(
+            [
+                ("📄 Checking Tailwind CSS source configuration...", typer.colors.CYAN),
+                (f"   • Source CSS path: {c.src_css}", typer.colors.BLUE),
+                (f"   • Overwrite default: {c.overwrite_default_config}", typer.colors.BLUE),
+                (f"   • DaisyUI enabled: {c.use_daisy_ui}", typer.colors.BLUE),
+            ]
+        )
 
     if not c.src_css:
         if verbose:
@@ -1677,6 +1834,8 @@ def _create_standard_config_with_verbose(*, verbose: bool = False) -> None:
         use_daisy_ui=c.use_daisy_ui,
         inject_external_apps=c.auto_source_external_apps,
     )
+    # Encoded once: compared byte-for-byte against the file and written as-is
+    data = content.encode("utf-8")
 
     if verbose:
         typer.secho(f"📝 Content template: {'DaisyUI' if c.use_daisy_ui else 'Default'}", fg=typer.colors.BLUE)
@@ -1687,7 +1846,7 @@ def _create_standard_config_with_verbose(*, verbose: bool = False) -> None:
     should_create = False
     if c.overwrite_default_config:
         # For default config, only create if file doesn't exist or content differs
-        should_create = _should_recreate_file(c.src_css, content)
+        should_create = _should_recreate_file(c.src_css, data)
         if verbose:
             existing_msg = "exists with different content" if c.src_css.exists() else "does not exist"
             typer.secho(f"🔍 File check (default config): {existing_msg}", fg=typer.colors.BLUE)
@@ -1703,7 +1862,7 @@ def _create_standard_config_with_verbose(*, verbose: bool = False) -> None:
             typer.secho("📝 Creating/updating source CSS file...", fg=typer.colors.CYAN)
 
         c.src_css.parent.mkdir(parents=True, exist_ok=True)
-        c.src_css.write_text(content)
+        c.src_css.write_bytes(data)
 
         if verbose:
             typer.secho(f"✅ Created directory: {c.src_css.parent}", fg=typer.colors.GREEN)
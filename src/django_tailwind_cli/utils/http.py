@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import re
+import shutil
 import socket
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, NamedTuple
 from collections.abc import Callable
 from urllib.error import HTTPError as UrllibHTTPError
 from urllib.error import URLError
-from urllib.request import Request, urlopen, HTTPRedirectHandler, build_opener
+from urllib.request import OpenerDirector, Request, urlopen, HTTPRedirectHandler, build_opener
 from typing import IO
 from http.client import HTTPMessage
 
@@ -16,6 +21,20 @@ if TYPE_CHECKING:
     pass
 
 
+# Read size for downloads. The Tailwind CLI is tens of MB, so large reads keep
+# the Python-level loop (and progress callbacks) to a few hundred iterations.
+_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Transient gateway errors from the release CDN are retried with exponential
+# backoff (0.5s, 1s, 2s) before the download is reported as failed.
+_DOWNLOAD_RETRIES = 3
+_DOWNLOAD_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
+# "bytes <first>-<last>/<complete length>" of a 206 response
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(\d+)")
+
+
 class RequestError(Exception):
     """Base exception for HTTP requests."""
 
@@ -32,6 +51,15 @@ class RequestTimeoutError(RequestError):
     """Request timeout error."""
 
 
+class RedirectResult(NamedTuple):
+    """Outcome of a redirect lookup."""
+
+    success: bool
+    location: str | None
+    etag: str | None = None
+    not_modified: bool = False
+
+
 class NoRedirectHandler(HTTPRedirectHandler):
     """HTTP redirect handler that captures redirect information without following."""
 
@@ -56,43 +84,58 @@ class NoRedirectHandler(HTTPRedirectHandler):
         return fp
 
 
-def fetch_redirect_location(url: str, timeout: int = 10) -> tuple[bool, str | None]:
-    """Fetch redirect location from a URL.
+@functools.cache
+def _get_redirect_opener() -> OpenerDirector:
+    """Return the shared opener used for redirect lookups.
+
+    Building an opener instantiates every default handler, so it is done once
+    per process. urllib opens a new connection per request regardless; the
+    in-process version memoization in config is what avoids repeat lookups.
+    """
+    return build_opener(NoRedirectHandler)
+
+
+def fetch_redirect(url: str, timeout: int = 10, *, etag: str | None = None) -> RedirectResult:
+    """Fetch redirect location and ETag from a URL.
 
     Args:
         url: URL to fetch from
         timeout: Request timeout in seconds
+        etag: ETag from a previous lookup, sent as If-None-Match
 
     Returns:
-        Tuple of (success, location_header)
+        RedirectResult; not_modified is set when the server answered 304 to the ETag
 
     Raises:
         RequestError: On network or HTTP errors
     """
     try:
-        # Create opener with no redirect handler to capture redirect responses
-        opener = build_opener(NoRedirectHandler)
+        # Opener with no redirect handler to capture redirect responses
+        opener = _get_redirect_opener()
 
-        req = Request(url)
+        # HEAD is enough: only the Location header is needed, not the page body
+        req = Request(url, method="HEAD")
         # Set User-Agent to avoid blocking
         req.add_header("User-Agent", "django-tailwind-cli")
+        if etag:
+            req.add_header("If-None-Match", etag)
 
         with opener.open(req, timeout=timeout) as response:
             # Check if it's a redirect status
             if response.getcode() in (301, 302, 303, 307, 308):
-                location = response.headers.get("Location")
-                return True, location
+                return RedirectResult(True, response.headers.get("Location"), response.headers.get("ETag"))
             elif response.getcode() == 200:
-                return True, None
+                return RedirectResult(True, None, response.headers.get("ETag"))
             else:
-                return False, None
+                return RedirectResult(False, None)
 
     except UrllibHTTPError as e:
         # Handle redirect responses that urllib might treat as errors
         if e.code in (301, 302, 303, 307, 308):
-            location = e.headers.get("Location")
-            return True, location
-        return False, None
+            return RedirectResult(True, e.headers.get("Location"), e.headers.get("ETag"))
+        if e.code == 304:
+            return RedirectResult(True, None, e.headers.get("ETag") or etag, not_modified=True)
+        return RedirectResult(False, None)
     except URLError as e:
         if isinstance(e.reason, socket.timeout):
             raise RequestTimeoutError(f"Request timeout: {e}") from e
@@ -106,52 +149,234 @@ def fetch_redirect_location(url: str, timeout: int = 10) -> tuple[bool, str | No
         raise RequestError(f"Unexpected error: {e}") from e
 
 
-def download_with_progress(
-    url: str, filepath: Path, timeout: int = 30, progress_callback: Callable[[int, int, float], None] | None = None
-) -> None:
-    """Download a file with progress indication.
+def fetch_redirect_location(url: str, timeout: int = 10) -> tuple[bool, str | None]:
+    """Fetch redirect location from a URL.
+
+    Args:
+        url: URL to fetch from
+        timeout: Request timeout in seconds
+
+    Returns:
+        Tuple of (success, location_header)
+
+    Raises:
+        RequestError: On network or HTTP errors
+    """
+    result = fetch_redirect(url, timeout)
+    return result.success, result.location
+
+
+def _open_with_retry(req: Request, timeout: int) -> Any:
+    """Open a request, retrying transient gateway errors.
+
+    Args:
+        req: Request to open
+        timeout: Request timeout in seconds
+
+    Returns:
+        The open response
+
+    Raises:
+        urllib.error.HTTPError: When the status is not retryable or retries are exhausted
+    """
+    for attempt in range(_DOWNLOAD_RETRIES):
+        try:
+            return urlopen(req, timeout=timeout)
+        except UrllibHTTPError as e:
+            if e.code not in _RETRY_STATUSES:
+                raise
+            e.close()
+            time.sleep(_DOWNLOAD_RETRY_BACKOFF * 2**attempt)
+    return urlopen(req, timeout=timeout)
+
+
+def _resume_validator(headers: Any) -> str | None:
+    """Return the validator an ``If-Range`` request can later resume this body with.
+
+    ``If-Range`` requires a strong validator, so weak ETags fall back to ``Last-Modified``.
+    """
+    etag = headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return headers.get("Last-Modified")
+
+
+def _content_range_total(header: str | None, start: int) -> int | None:
+    """Return the complete size from a ``Content-Range`` header continuing at ``start``.
+
+    Returns:
+        The total size, or None if the header is missing, unparseable or starts elsewhere.
+    """
+    match = _CONTENT_RANGE.fullmatch(header or "")
+    if not match or int(match[1]) != start:
+        return None
+    return int(match[2])
+
+
+def _partial_paths(filepath: Path) -> tuple[Path, Path]:
+    """Return the partial body and resume validator files used while downloading ``filepath``."""
+    return filepath.with_name(f"{filepath.name}.part"), filepath.with_name(f"{filepath.name}.part.validator")
+
+
+def discard_partial_download(filepath: Path) -> None:
+    """Remove what an interrupted download of ``filepath`` left behind, so the next one starts over.
+
+    Args:
+        filepath: Destination file path of the download
+    """
+    for path in _partial_paths(filepath):
+        path.unlink(missing_ok=True)
+
+
+class _RangeNotContinuedError(Exception):
+    """The server did not continue a partial download where it left off."""
+
+
+def _download_to_partial(
+    url: str,
+    filepath: Path,
+    timeout: int,
+    progress_callback: Callable[[int, int, float], None] | None,
+    *,
+    resume: bool,
+) -> int:
+    """Write the body of ``url`` to the ``.part`` file of ``filepath``.
 
     Args:
         url: Download URL
         filepath: Destination file path
         timeout: Request timeout in seconds
         progress_callback: Optional callback for progress updates
+        resume: Continue the existing ``.part`` file if it has a validator
+
+    Returns:
+        The announced size of the complete file, 0 if unknown.
 
     Raises:
-        RequestError: On network or HTTP errors
+        _RangeNotContinuedError: If a resumed range was rejected (``416``) or does not continue the file;
+            the response is closed by then. Never raised with ``resume=False``.
     """
-    try:
-        req = Request(url)
-        req.add_header("User-Agent", "django-tailwind-cli")
-
-        with urlopen(req, timeout=timeout) as response:
-            # Check for HTTP errors
-            if response.getcode() >= 400:
-                raise HTTPError(f"HTTP {response.getcode()}: {response.reason}")
+    partial, validator_path = _partial_paths(filepath)
+
+    resume_from = 0
+    validator = None
+    if resume:
+        try:
+            resume_from = partial.stat().st_size
+            validator = validator_path.read_text().strip() or None
+        except OSError:
+            resume_from = 0
+    if not resume_from or validator is None:
+        # A range without a validator could splice two different files together
+        resume_from = 0
+        discard_partial_download(filepath)
+
+    req = Request(url)
+    req.add_header("User-Agent", "django-tailwind-cli")
+    if resume_from and validator:
+        req.add_header("Range", f"bytes={resume_from}-")
+        req.add_header("If-Range", validator)
 
-            # Get content length for progress tracking
+    try:
+        response = _open_with_retry(req, timeout)
+    except UrllibHTTPError as e:
+        if e.code != 416 or not resume_from:
+            raise
+        e.close()
+        raise _RangeNotContinuedError from e
+
+    with response:
+        # Check for HTTP errors
+        if response.getcode() >= 400:
+            raise HTTPError(f"HTTP {response.getcode()}: {response.reason}")
+
+        if resume_from and response.getcode() == 206:
+            total_size = _content_range_total(response.headers.get("Content-Range"), resume_from)
+            if total_size is None:
+                # Not the continuation that was asked for
+                raise _RangeNotContinuedError
+        else:
+            # Anything but 206 Partial Content is the whole body
+            resume_from = 0
             content_length_header = response.headers.get("Content-Length")
             total_size = int(content_length_header) if content_length_header else 0
 
-            # Ensure parent directory exists
-            filepath.parent.mkdir(parents=True, exist_ok=True)
+        # Ensure parent directory exists
+        filepath.parent.mkdir(parents=True, exist_ok=True)
 
-            downloaded = 0
-            chunk_size = 8192
+        if not resume_from:
+            validator = _resume_validator(response.headers)
+            if validator:
+                validator_path.write_text(validator)
+            else:
+                validator_path.unlink(missing_ok=True)
 
-            with filepath.open("wb") as f:
+        with partial.open("ab" if resume_from else "wb") as f:
+            if not progress_callback or total_size <= 0:
+                # Nothing to report, let shutil do the copy loop
+                shutil.copyfileobj(response, f, _DOWNLOAD_CHUNK_SIZE)
+            else:
+                downloaded = resume_from
                 while True:
-                    chunk = response.read(chunk_size)
+                    chunk = response.read(_DOWNLOAD_CHUNK_SIZE)
                     if not chunk:
                         break
 
                     f.write(chunk)
                     downloaded += len(chunk)
+                    progress_callback(downloaded, total_size, (downloaded / total_size) * 100)
+
+    return total_size
+
+
+def download_with_progress(
+    url: str,
+    filepath: Path,
+    timeout: int = 30,
+    progress_callback: Callable[[int, int, float], None] | None = None,
+    *,
+    resume: bool = True,
+) -> None:
+    """Download a file with progress indication.
 
-                    # Call progress callback if provided
-                    if progress_callback and total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        progress_callback(downloaded, total_size, progress)
+    The body is written to a ``.part`` file next to ``filepath`` and moved into
+    place only once it is complete, so an interrupted download never leaves a
+    truncated file at ``filepath``. The ``.part`` file is kept on failure along
+    with the response's ETag or Last-Modified validator, and the next call
+    resumes it with a ``Range`` plus ``If-Range`` request. Without a validator,
+    or when the server answers with the whole body (``200``), the download
+    starts over. If the server rejects the range (``416``) or returns one that
+    does not continue the file, the partial download is discarded and fetched
+    again once from the start.
+
+    Args:
+        url: Download URL
+        filepath: Destination file path
+        timeout: Request timeout in seconds
+        progress_callback: Optional callback for progress updates
+        resume: Continue a previous partial download; False discards it first
+
+    Raises:
+        RequestError: On network or HTTP errors, or if the body is incomplete
+    """
+    partial, validator_path = _partial_paths(filepath)
+
+    try:
+        try:
+            total_size = _download_to_partial(url, filepath, timeout, progress_callback, resume=resume)
+        except _RangeNotContinuedError:
+            # The partial file is not a prefix of this asset, start over
+            total_size = _download_to_partial(url, filepath, timeout, progress_callback, resume=False)
+
+        size = partial.stat().st_size
+        if total_size and size != total_size:
+            if size > total_size:
+                # Can't be resumed from, only a fresh download helps
+                discard_partial_download(filepath)
+            raise RequestError(f"Incomplete download: got {size} of {total_size} bytes")
+
+        os.replace(partial, filepath)
+        validator_path.unlink(missing_ok=True)
 
     except RequestError:
         # Don't re-wrap exceptions we raised ourselves (e.g. the HTTPError
@@ -0,0 +1,17 @@
+# pyright: reportPrivateUsage=false
+import pytest
+
+from django_tailwind_cli.config import _build_config, _get_latest_version, get_platform_info
+from django_tailwind_cli.management.commands.tailwind import _exists_bucketed, _has_runserver_plus
+from django_tailwind_cli.utils import http
+
+
+@pytest.fixture(autouse=True)
+def clear_in_process_caches():
+    """Reset process-wide memoization so each test starts from a clean slate."""
+    _get_latest_version.cache_clear()
+    _build_config.cache_clear()
+    get_platform_info.cache_clear()
+    http._get_redirect_opener.cache_clear()
+    _exists_bucketed.cache_clear()
+    _has_runserver_plus.cache_clear()
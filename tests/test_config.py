@@ -1,4 +1,6 @@
 # pyright: reportPrivateUsage=false
+import os
+import time
 from pathlib import Path
 
 import pytest
@@ -6,18 +8,27 @@ from _pytest.recwarn import WarningsChecker
 from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockerFixture
 
-from django_tailwind_cli.config import get_config, get_version
+from django_tailwind_cli.config import PlatformInfo, _normalize_platform, get_config, get_version
+from django_tailwind_cli.utils.http import RedirectResult
+
+
+# Immutable, so every test can share the same instances
+_LATEST_RELEASE_REDIRECT = RedirectResult(True, "https://github.com/tailwindlabs/tailwindcss/releases/tag/v4.1.3")
+_BASE_DIR = Path("/home/user/project")
+_STATICFILES_DIRS = (_BASE_DIR / "assets",)
 
 
 @pytest.fixture(autouse=True)
 def configure_settings(
     settings: SettingsWrapper,
     mocker: MockerFixture,
+    tmp_path: Path,
 ):
-    settings.BASE_DIR = Path("/home/user/project")
-    settings.STATICFILES_DIRS = (settings.BASE_DIR / "assets",)
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (True, "https://github.com/tailwindlabs/tailwindcss/releases/tag/v4.1.3")
+    settings.BASE_DIR = _BASE_DIR
+    settings.STATICFILES_DIRS = _STATICFILES_DIRS
+    mocker.patch("django_tailwind_cli.utils.http.fetch_redirect", return_value=_LATEST_RELEASE_REDIRECT)
+    # Give every test its own, empty version cache instead of the shared one in the temp dir
+    mocker.patch("django_tailwind_cli.config._get_cache_path", return_value=tmp_path / "version_cache.json")
 
 
 @pytest.mark.parametrize(
@@ -38,16 +49,9 @@ def test_get_version(
 
     # For "latest" version test, mock the network request to ensure fallback
     if version_str == "latest":
-        # Clear any existing cache
-        from django_tailwind_cli.config import _get_cache_path
-
-        cache_path = _get_cache_path()
-        if cache_path.exists():
-            cache_path.unlink()
-
         # Mock failed network request to force fallback
-        request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-        request_get.return_value = (False, None)
+        request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+        request_get.return_value = RedirectResult(False, None)
 
     r_version_str, r_version = get_version()
     assert r_version_str == expected_version_str
@@ -56,16 +60,13 @@ def test_get_version(
     assert r_version.patch == version[2]
 
 
-def test_get_version_latest_without_proper_http_response(mocker: MockerFixture):
-    # Clear any existing cache
-    from django_tailwind_cli.config import _get_cache_path
-
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
-
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (False, None)
+@pytest.mark.parametrize(
+    "redirect",
+    [RedirectResult(False, None), RedirectResult(True, None)],
+    ids=["without_proper_http_response", "without_redirect"],
+)
+def test_get_version_latest_falls_back(mocker: MockerFixture, redirect: RedirectResult):
+    mocker.patch("django_tailwind_cli.utils.http.fetch_redirect", return_value=redirect)
 
     r_version_str, r_version = get_version()
     assert r_version_str == "4.1.3"
@@ -74,22 +75,46 @@ def test_get_version_latest_without_proper_http_response(mocker: MockerFixture):
     assert r_version.patch == 3
 
 
-def test_get_version_latest_without_redirect(mocker: MockerFixture):
-    # Clear any existing cache
-    from django_tailwind_cli.config import _get_cache_path
+def test_get_version_latest_is_memoized_per_process(mocker: MockerFixture):
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(True, "https://github.com/tailwindlabs/tailwindcss/releases/tag/v4.1.5")
+
+    assert get_version()[0] == "4.1.5"
+    assert get_version()[0] == "4.1.5"
+    request_get.assert_called_once()
+
+
+def test_version_cache_keeps_one_entry_per_repository():
+    from django_tailwind_cli.config import _load_cached_version, _save_cached_version
+
+    _save_cached_version("tailwindlabs/tailwindcss", "4.1.5")
+    _save_cached_version("dobicinaitis/tailwind-cli-extra", "2.0.1")
+
+    tailwind = _load_cached_version("tailwindlabs/tailwindcss")
+    extra = _load_cached_version("dobicinaitis/tailwind-cli-extra")
+    assert tailwind is not None and tailwind.version_str == "4.1.5"
+    assert extra is not None and extra.version_str == "2.0.1"
+    assert _load_cached_version("unknown/repo") is None
+
+
+def test_expired_version_cache_is_revalidated_with_etag(mocker: MockerFixture):
+    import json
+
+    from django_tailwind_cli.config import _VERSION_CACHE_TTL, _get_cache_path, _load_cached_version
 
     cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
+    stale = time.time() - _VERSION_CACHE_TTL - 1
+    cache_path.write_text(
+        json.dumps({"tailwindlabs/tailwindcss": {"version": "4.1.4", "etag": '"abc"', "fetched_at": stale}})
+    )
 
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (True, None)
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(True, None, '"abc"', not_modified=True)
 
-    r_version_str, r_version = get_version()
-    assert r_version_str == "4.1.3"
-    assert r_version.major == 4
-    assert r_version.minor == 1
-    assert r_version.patch == 3
+    assert get_version()[0] == "4.1.4"
+    assert request_get.call_args.kwargs["etag"] == '"abc"'
+    refreshed = _load_cached_version("tailwindlabs/tailwindcss")
+    assert refreshed is not None and refreshed.timestamp > stale
 
 
 def test_get_version_with_official_repo_and_version_3(settings: SettingsWrapper):
@@ -100,21 +125,15 @@ def test_get_version_with_official_repo_and_version_3(settings: SettingsWrapper)
 
 def test_get_version_with_daisyui_enabled_latest(settings: SettingsWrapper, mocker: MockerFixture):
     """Test that DaisyUI uses the correct repository and correctly parses version."""
-    # Clear any existing cache
-    from django_tailwind_cli.config import _get_cache_path
     from semver import Version
 
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
-
     settings.TAILWIND_CLI_USE_DAISY_UI = True
     settings.TAILWIND_CLI_VERSION = "latest"
 
     # Mock successful redirect to a generic valid DaisyUI version
     test_version = "9.8.7"
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(
         True,
         f"https://github.com/dobicinaitis/tailwind-cli-extra/releases/tag/v{test_version}",
     )
@@ -130,26 +149,21 @@ def test_get_version_with_daisyui_enabled_latest(settings: SettingsWrapper, mock
 
     # Verify the correct DaisyUI repository URL was used (not standard Tailwind)
     request_get.assert_called_once_with(
-        "https://github.com/dobicinaitis/tailwind-cli-extra/releases/latest/", timeout=10
+        "https://github.com/dobicinaitis/tailwind-cli-extra/releases/latest/", timeout=10, etag=None
     )
 
 
 def test_get_version_with_daisyui_fallback_when_network_fails(settings: SettingsWrapper, mocker: MockerFixture):
     """Test fallback behavior when DaisyUI is enabled but network request fails."""
-    # Clear any existing cache
-    from django_tailwind_cli.config import _get_cache_path, FALLBACK_VERSION
+    from django_tailwind_cli.config import FALLBACK_VERSION
     from semver import Version
 
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
-
     settings.TAILWIND_CLI_USE_DAISY_UI = True
     settings.TAILWIND_CLI_VERSION = "latest"
 
     # Mock failed network request
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (False, None)
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(False, None)
 
     r_version_str, r_version = get_version()
 
@@ -160,7 +174,7 @@ def test_get_version_with_daisyui_fallback_when_network_fails(settings: Settings
 
     # Verify the correct DaisyUI repository URL was still used in the attempt
     request_get.assert_called_once_with(
-        "https://github.com/dobicinaitis/tailwind-cli-extra/releases/latest/", timeout=10
+        "https://github.com/dobicinaitis/tailwind-cli-extra/releases/latest/", timeout=10, etag=None
     )
 
 
@@ -228,64 +242,33 @@ def test_prefixed_setting_for_staticfiles_dirs(settings: SettingsWrapper):
     assert c.dist_css == Path("path/css/tailwind.css")
 
 
-def test_invalid_settings_for_tailwind_cli_dist_css(settings: SettingsWrapper):
-    settings.TAILWIND_CLI_DIST_CSS = None
-    with pytest.raises(ValueError, match="TAILWIND_CLI_DIST_CSS must not be None."):
-        get_config()
-
-
-def test_invalid_settings_for_tailwind_cli_assert_name(settings: SettingsWrapper):
-    settings.TAILWIND_CLI_ASSET_NAME = None
-    with pytest.raises(ValueError, match="TAILWIND_CLI_ASSET_NAME must not be None."):
-        get_config()
-
-
-def test_invalid_settings_for_tailwind_cli_src_repo(settings: SettingsWrapper):
-    settings.TAILWIND_CLI_SRC_REPO = None
-    with pytest.raises(ValueError, match="TAILWIND_CLI_SRC_REPO must not be None."):
-        get_config()
-
-
 @pytest.mark.parametrize(
-    "platform,machine,result",
-    [
-        ("Windows", "x86_64", "tailwindcss-windows-x64.exe"),
-        ("Windows", "amd64", "tailwindcss-windows-x64.exe"),
-        ("Darwin", "aarch64", "tailwindcss-macos-arm64"),
-        ("Darwin", "arm64", "tailwindcss-macos-arm64"),
-    ],
+    "setting",
+    ["TAILWIND_CLI_DIST_CSS", "TAILWIND_CLI_ASSET_NAME", "TAILWIND_CLI_SRC_REPO"],
 )
-def test_download_url(mocker: MockerFixture, platform: str, machine: str, result: str):
-    platform_system = mocker.patch("platform.system")
-    platform_system.return_value = platform
-
-    platform_machine = mocker.patch("platform.machine")
-    platform_machine.return_value = machine
-
-    c = get_config()
-    assert c.download_url.endswith(result)
+def test_invalid_none_settings(settings: SettingsWrapper, setting: str):
+    setattr(settings, setting, None)
+    with pytest.raises(ValueError, match=f"{setting} must not be None."):
+        get_config()
 
 
 @pytest.mark.parametrize(
-    "platform,machine,result",
+    "platform,machine,download_asset,cli_asset",
     [
-        ("Windows", "x86_64", "tailwindcss-windows-x64-4.0.0.exe"),
-        ("Windows", "amd64", "tailwindcss-windows-x64-4.0.0.exe"),
-        ("Darwin", "aarch64", "tailwindcss-macos-arm64-4.0.0"),
-        ("Darwin", "arm64", "tailwindcss-macos-arm64-4.0.0"),
+        ("Windows", "x86_64", "tailwindcss-windows-x64.exe", "tailwindcss-windows-x64-4.0.0.exe"),
+        ("Darwin", "arm64", "tailwindcss-macos-arm64", "tailwindcss-macos-arm64-4.0.0"),
     ],
 )
-def test_get_cli_path(settings: SettingsWrapper, mocker: MockerFixture, platform: str, machine: str, result: str):
+def test_platform_in_download_url_and_cli_path(
+    settings: SettingsWrapper, mocker: MockerFixture, platform: str, machine: str, download_asset: str, cli_asset: str
+):
     settings.TAILWIND_CLI_VERSION = "4.0.0"
-
-    platform_system = mocker.patch("platform.system")
-    platform_system.return_value = platform
-
-    platform_machine = mocker.patch("platform.machine")
-    platform_machine.return_value = machine
+    mocker.patch("platform.system", return_value=platform)
+    mocker.patch("platform.machine", return_value=machine)
 
     c = get_config()
-    assert str(c.cli_path).endswith(result)
+    assert c.download_url.endswith(download_asset)
+    assert str(c.cli_path).endswith(cli_asset)
 
 
 def test_cli_path_to_existing_file(settings: SettingsWrapper, tmp_path: Path):
@@ -295,44 +278,36 @@ def test_cli_path_to_existing_file(settings: SettingsWrapper, tmp_path: Path):
     assert str(c.cli_path) == str(tmp_path / "tailwindcss")
 
 
-def test_cli_path_to_existing_directory(settings: SettingsWrapper):
-    settings.TAILWIND_CLI_PATH = "/opt/bin"
-    c = get_config()
-    assert "/opt/bin/tailwindcss-" in str(c.cli_path)
+def test_cli_path_not_executable_by_current_user(settings: SettingsWrapper, tmp_path: Path, mocker: MockerFixture):
+    settings.TAILWIND_CLI_PATH = tmp_path / "tailwindcss"
+    settings.TAILWIND_CLI_PATH.touch(mode=0o755, exist_ok=True)
+    # Execute bits are set, but they belong to another user or group
+    access = mocker.patch("django_tailwind_cli.config.os.access", return_value=False)
 
+    c = get_config()
+    access.assert_called_once_with(tmp_path / "tailwindcss", os.X_OK)
+    assert c.cli_path.parent == tmp_path / "tailwindcss"
 
-@pytest.mark.parametrize(
-    "system, result",
-    [
-        ("Windows", "windows"),
-        ("Darwin", "macos"),
-        ("Linux", "linux"),
-    ],
-)
-def test_system(system: str, result: str, mocker: MockerFixture):
-    platform_system = mocker.patch("platform.system")
-    platform_system.return_value = system
 
+def test_cli_path_to_existing_directory(settings: SettingsWrapper):
+    settings.TAILWIND_CLI_PATH = "/opt/bin"
     c = get_config()
-    assert result in str(c.cli_path)
-    assert result in c.download_url
+    assert "/opt/bin/tailwindcss-" in str(c.cli_path)
 
 
 @pytest.mark.parametrize(
-    "machine, result",
+    "system,machine,result",
     [
-        ("x86_64", "x64"),
-        ("amd64", "x64"),
-        ("aarch64", "arm64"),
+        ("Windows", "x86_64", PlatformInfo("windows", "x64", ".exe")),
+        ("Windows", "amd64", PlatformInfo("windows", "x64", ".exe")),
+        ("Darwin", "aarch64", PlatformInfo("macos", "arm64", "")),
+        ("Darwin", "arm64", PlatformInfo("macos", "arm64", "")),
+        ("Linux", "x86_64", PlatformInfo("linux", "x64", "")),
+        ("Linux", "aarch64", PlatformInfo("linux", "arm64", "")),
     ],
 )
-def test_machine(machine: str, result: str, mocker: MockerFixture):
-    platform_machine = mocker.patch("platform.machine")
-    platform_machine.return_value = machine
-
-    c = get_config()
-    assert result in str(c.cli_path)
-    assert result in c.download_url
+def test_normalize_platform(system: str, machine: str, result: PlatformInfo):
+    assert _normalize_platform(system, machine) == result
 
 
 def test_build_cmd():
@@ -347,6 +322,12 @@ def test_build_cmd():
     ]
 
 
+def test_build_cmd_returns_a_fresh_list():
+    c = get_config()
+    c.build_cmd.append("--extra")
+    assert "--extra" not in c.build_cmd
+
+
 def test_watch_cmd():
     c = get_config()
     assert c.watch_cmd == [
@@ -363,18 +344,12 @@ def test_daisy_ui_support(
     settings: SettingsWrapper,
     mocker: MockerFixture,
 ):
-    from django_tailwind_cli.config import _get_cache_path
     from semver import Version
 
-    # Clear any existing cache to prevent interference from other tests
-    cache_path = _get_cache_path()
-    if cache_path.exists():
-        cache_path.unlink()
-
     settings.TAILWIND_CLI_USE_DAISY_UI = True
     test_version = "7.6.5"
-    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect_location")
-    request_get.return_value = (
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(
         True,
         f"https://github.com/dobicinaitis/tailwind-cli-extra/releases/tag/v{test_version}",
     )
@@ -818,3 +793,93 @@ def test_detect_binary_version_handles_semver_parse_failure(mocker: MockerFixtur
     mocker.patch("django_tailwind_cli.config.Version.parse", side_effect=ValueError("simulated"))
 
     assert detect_binary_version(binary) is None
+
+
+# Memoization -------------------------------------------------------------------------------------
+
+
+def test_config_is_immutable():
+    import dataclasses
+
+    c = get_config()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        c.version_str = "0.0.0"  # pyright: ignore[reportAttributeAccessIssue]
+    assert not hasattr(c, "__dict__")
+    # The precomputed commands are derived from css_entries, so it must not be mutable either
+    assert isinstance(c.css_entries, tuple)
+
+
+def test_get_config_is_memoized():
+    assert get_config() is get_config()
+
+
+def test_get_config_cache_is_cleared_on_setting_change(settings: SettingsWrapper):
+    c = get_config()
+    settings.TAILWIND_CLI_DIST_CSS = "css/other.css"
+    assert get_config() is not c
+    assert str(get_config().dist_css) == "/home/user/project/assets/css/other.css"
+
+
+def test_get_config_cache_ignores_unrelated_settings(settings: SettingsWrapper):
+    c = get_config()
+    settings.DEBUG = not settings.DEBUG
+    assert get_config() is c
+
+
+def test_get_config_cache_follows_override_settings():
+    from django.test import override_settings
+
+    default = get_config()
+    with override_settings(TAILWIND_CLI_DIST_CSS="css/overridden.css"):
+        overridden = get_config()
+        assert overridden is not default
+        assert overridden.dist_css_base == "css/overridden.css"
+        assert get_config() is overridden
+    assert get_config().dist_css_base == "css/tailwind.css"
+
+
+def test_get_config_does_not_keep_fallback_version(mocker: MockerFixture):
+    from django_tailwind_cli.config import FALLBACK_VERSION
+
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(False, None)
+    fallback = get_config()
+    assert fallback.version_str == FALLBACK_VERSION
+    assert fallback.is_fallback_version
+
+    request_get.return_value = RedirectResult(True, "https://github.com/tailwindlabs/tailwindcss/releases/tag/v4.1.5")
+    assert get_config().version_str == "4.1.5"
+    assert get_config() is get_config()
+
+
+@pytest.mark.parametrize("age, expected", [(-1, "4.1.4"), (0, "4.1.6")], ids=["before_expiry", "at_expiry"])
+def test_get_config_latest_version_expires_with_version_cache(mocker: MockerFixture, age: int, expected: str):
+    import json
+
+    from django_tailwind_cli.config import _VERSION_CACHE_TTL, _get_cache_path
+
+    fetched_at = 1_000_000.0
+    _get_cache_path().write_text(
+        json.dumps({"tailwindlabs/tailwindcss": {"version": "4.1.4", "etag": None, "fetched_at": fetched_at}})
+    )
+    clock = mocker.patch("django_tailwind_cli.config.time")
+    clock.time.return_value = fetched_at
+    request_get = mocker.patch("django_tailwind_cli.utils.http.fetch_redirect")
+    request_get.return_value = RedirectResult(True, "https://github.com/tailwindlabs/tailwindcss/releases/tag/v4.1.6")
+    assert get_config().version_str == "4.1.4"
+
+    # The in-process config and version expire on the on-disk entry's fetched_at, not on their own clock
+    clock.time.return_value = fetched_at + _VERSION_CACHE_TTL + age
+    assert get_config().version_str == expected
+    assert get_version()[0] == expected
+    assert request_get.call_count == (expected == "4.1.6")
+
+
+def test_load_settings_reads_configured_values_and_defaults(settings: SettingsWrapper):
+    from django_tailwind_cli.config import _UNSET, _load_settings
+
+    settings.TAILWIND_CLI_VERSION = "4.0.0"
+    values = _load_settings()
+    assert values["TAILWIND_CLI_VERSION"] == "4.0.0"
+    assert values["TAILWIND_CLI_AUTOMATIC_DOWNLOAD"] is True
+    assert values["TAILWIND_CLI_SRC_REPO"] is _UNSET
@@ -134,7 +134,7 @@ class TestNetworkErrorScenarios:
         if cache_path.exists():
             cache_path.unlink()
 
-        with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
+        with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
             mock_fetch.side_effect = http.RequestTimeoutError("Connection timeout")
 
             # Should fall back to fallback version
@@ -151,7 +151,7 @@ class TestNetworkErrorScenarios:
         if cache_path.exists():
             cache_path.unlink()
 
-        with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
+        with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
             mock_fetch.side_effect = http.NetworkConnectionError("Network unreachable")
 
             # Should fall back to fallback version
@@ -168,8 +168,8 @@ class TestNetworkErrorScenarios:
         if cache_path.exists():
             cache_path.unlink()
 
-        with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
-            mock_fetch.return_value = (False, None)
+        with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
+            mock_fetch.return_value = http.RedirectResult(False, None)
 
             # Should fall back to fallback version
             version_str, _ = get_version()
@@ -221,8 +221,8 @@ class TestNetworkErrorScenarios:
         cache_path.parent.mkdir(parents=True, exist_ok=True)
         cache_path.write_text("corrupted\ncache\ndata")
 
-        with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
-            mock_fetch.return_value = (True, "https://github.com/repo/releases/tag/v4.1.0")
+        with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
+            mock_fetch.return_value = http.RedirectResult(True, "https://github.com/repo/releases/tag/v4.1.0")
 
             # Should handle corrupted cache gracefully and fetch new version
             version_str, _ = get_version()
@@ -548,8 +548,8 @@ class TestConcurrencyErrorScenarios:
         if cache_path.exists():
             cache_path.unlink()
 
-        with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
-            mock_fetch.return_value = (True, "https://github.com/repo/releases/tag/v4.1.5")
+        with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
+            mock_fetch.return_value = http.RedirectResult(True, "https://github.com/repo/releases/tag/v4.1.5")
 
             # Should handle version fetch gracefully
             version_str, parsed_version = get_version()
@@ -662,8 +662,8 @@ class TestEdgeCaseScenarios:
         ]
 
         for location in malformed_locations:
-            with patch("django_tailwind_cli.utils.http.fetch_redirect_location") as mock_fetch:
-                mock_fetch.return_value = (True, location)
+            with patch("django_tailwind_cli.utils.http.fetch_redirect") as mock_fetch:
+                mock_fetch.return_value = http.RedirectResult(True, location)
 
                 # Should fall back to fallback version on parsing errors
                 version_str, _ = get_version()
@@ -700,6 +700,7 @@ class TestEdgeCaseScenarios:
             assert info.extension == ""  # Should default to no extension
 
         # Test various platform.machine() return values
+        get_platform_info.cache_clear()
         with patch("platform.machine", return_value="unknown_arch"):
             info = get_platform_info()
             assert info.machine == "unknown_arch"  # Should preserve unknown architectures
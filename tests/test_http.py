@@ -4,6 +4,7 @@ This module tests the custom HTTP implementation that replaced the requests depe
 Covers both the happy paths (200 responses, chunked downloads with progress callbacks)
 and the error paths (timeouts, connection failures, HTTP 4xx/5xx, generic URLErrors).
 """
+# pyright: reportPrivateUsage=false
 
 import socket
 from io import BytesIO
@@ -176,6 +177,55 @@ class TestFetchRedirectLocationHappyPaths:
         assert success is True
         assert location == "https://example.com/target"
 
+    def test_redirect_lookup_uses_head_request(self):
+        response = _build_response_mock(code=302, location="https://example.com/target")
+
+        with patch("django_tailwind_cli.utils.http.build_opener") as mock_build_opener:
+            mock_build_opener.return_value.open.return_value = response
+
+            http.fetch_redirect_location("https://example.com")
+
+        req = mock_build_opener.return_value.open.call_args.args[0]
+        assert req.get_method() == "HEAD"
+
+    def test_etag_is_sent_and_304_reports_not_modified(self):
+        error = UrllibHTTPError(
+            url="https://example.com",
+            code=304,
+            msg="Not Modified",
+            hdrs={"ETag": '"abc"'},  # pyright: ignore[reportArgumentType]
+            fp=None,
+        )
+
+        with patch("django_tailwind_cli.utils.http.build_opener") as mock_build_opener:
+            mock_build_opener.return_value.open.side_effect = error
+
+            result = http.fetch_redirect("https://example.com", etag='"abc"')
+
+        req = mock_build_opener.return_value.open.call_args.args[0]
+        assert req.get_header("If-none-match") == '"abc"'
+        assert result.not_modified is True
+        assert result.etag == '"abc"'
+
+    def test_redirect_returns_etag(self):
+        response = _build_response_mock(code=302, location="https://example.com/target")
+        response.headers["ETag"] = '"xyz"'
+
+        with patch("django_tailwind_cli.utils.http.build_opener") as mock_build_opener:
+            mock_build_opener.return_value.open.return_value = response
+
+            result = http.fetch_redirect("https://example.com")
+
+        assert result == http.RedirectResult(True, "https://example.com/target", '"xyz"')
+
+    def test_redirect_opener_is_reused(self):
+        with patch("django_tailwind_cli.utils.http.build_opener") as mock_build_opener:
+            mock_build_opener.return_value.open.return_value = _build_response_mock(code=302, location="/a")
+            http.fetch_redirect_location("https://example.com")
+            http.fetch_redirect_location("https://example.com")
+
+        mock_build_opener.assert_called_once_with(http.NoRedirectHandler)
+
     def test_200_response_returns_success_no_location(self):
         response = _build_response_mock(code=200)
 
@@ -234,11 +284,17 @@ class TestFetchRedirectLocationHappyPaths:
         assert location is None
 
 
+def _write_partial(filepath: Path, body: bytes, validator: str) -> None:
+    """Leave the files an interrupted download of ``filepath`` would have left behind."""
+    filepath.with_name(f"{filepath.name}.part").write_bytes(body)
+    filepath.with_name(f"{filepath.name}.part.validator").write_text(validator)
+
+
 class TestDownloadWithProgressHappyPath:
     """Happy-path tests for download_with_progress."""
 
     def test_download_writes_chunks_and_invokes_progress_callback(self, tmp_path: Path):
-        body = b"A" * 20000  # slightly over two 8192 chunks
+        body = b"A" * (2 * http._DOWNLOAD_CHUNK_SIZE + 1000)  # slightly over two chunks
         response = _build_response_mock(code=200, content_length=str(len(body)), body=body)
         filepath = tmp_path / "subdir" / "downloaded.bin"
 
@@ -253,8 +309,8 @@ class TestDownloadWithProgressHappyPath:
         # Parent directory auto-created
         assert filepath.parent.exists()
         assert filepath.read_bytes() == body
-        # Progress callback invoked for each chunk (at least 3 for 20000 bytes / 8192)
-        assert len(progress_events) >= 3
+        # Progress callback invoked for each chunk
+        assert len(progress_events) == 3
         # Final event reports full size and 100%
         assert progress_events[-1][0] == len(body)
         assert progress_events[-1][1] == len(body)
@@ -277,6 +333,121 @@ class TestDownloadWithProgressHappyPath:
         # Without Content-Length, total_size stays 0 and the callback branch is skipped.
         assert calls == []
 
+    def test_interrupted_download_keeps_existing_file(self, tmp_path: Path):
+        response = _build_response_mock(code=200, content_length="1000")
+        response.headers["ETag"] = '"v1"'
+        response.read = MagicMock(side_effect=[b"A" * 500, TimeoutError("stalled")])
+        filepath = tmp_path / "tailwindcss"
+        filepath.write_bytes(b"previous binary")
+
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response):
+            with pytest.raises(http.RequestTimeoutError):
+                http.download_with_progress("https://example.com/file.bin", filepath, progress_callback=MagicMock())
+
+        assert filepath.read_bytes() == b"previous binary"
+        # What arrived is kept, with its validator, for the next attempt to resume
+        assert (tmp_path / "tailwindcss.part").read_bytes() == b"A" * 500
+        assert (tmp_path / "tailwindcss.part.validator").read_text() == '"v1"'
+
+    def test_partial_download_is_resumed_with_if_range_request(self, tmp_path: Path):
+        filepath = tmp_path / "tailwindcss"
+        _write_partial(filepath, b"A" * 500, '"v1"')
+        response = _build_response_mock(code=206, content_length="500", body=b"B" * 500)
+        response.headers["Content-Range"] = "bytes 500-999/1000"
+        progress_callback = MagicMock()
+
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response) as mock_urlopen:
+            http.download_with_progress("https://example.com/file.bin", filepath, progress_callback=progress_callback)
+
+        request = mock_urlopen.call_args.args[0]
+        assert request.get_header("Range") == "bytes=500-"
+        assert request.get_header("If-range") == '"v1"'
+        assert filepath.read_bytes() == b"A" * 500 + b"B" * 500
+        assert progress_callback.call_args.args == (1000, 1000, 100.0)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tailwindcss"]
+
+    def test_partial_without_validator_is_not_resumed(self, tmp_path: Path):
+        filepath = tmp_path / "tailwindcss"
+        (tmp_path / "tailwindcss.part").write_bytes(b"stale")
+        response = _build_response_mock(code=200, content_length="4", body=b"full")
+
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response) as mock_urlopen:
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert mock_urlopen.call_args.args[0].get_header("Range") is None
+        assert filepath.read_bytes() == b"full"
+
+    def test_discard_partial_download_prevents_resume(self, tmp_path: Path):
+        filepath = tmp_path / "tailwindcss"
+        _write_partial(filepath, b"stale", '"v1"')
+        response = _build_response_mock(code=200, content_length="4", body=b"full")
+
+        http.discard_partial_download(filepath)
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response) as mock_urlopen:
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert mock_urlopen.call_args.args[0].get_header("Range") is None
+        assert filepath.read_bytes() == b"full"
+
+    def test_changed_asset_restarts_download(self, tmp_path: Path):
+        # The validator no longer matches, so the server ignores the range and sends everything
+        filepath = tmp_path / "tailwindcss"
+        _write_partial(filepath, b"stale", '"v1"')
+        response = _build_response_mock(code=200, content_length="4", body=b"full")
+        response.headers["ETag"] = '"v2"'
+
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response):
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert filepath.read_bytes() == b"full"
+
+    def test_mismatched_content_range_restarts_download(self, tmp_path: Path):
+        filepath = tmp_path / "tailwindcss"
+        _write_partial(filepath, b"A" * 500, '"v1"')
+        wrong_range = _build_response_mock(code=206, content_length="500", body=b"B" * 500)
+        wrong_range.headers["Content-Range"] = "bytes 0-499/1000"
+        response = _build_response_mock(code=200, content_length="4", body=b"full")
+
+        with patch("django_tailwind_cli.utils.http.urlopen", side_effect=[wrong_range, response]) as mock_urlopen:
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        # Exactly one fresh attempt, and nothing from the discarded partial is left behind
+        assert mock_urlopen.call_count == 2
+        assert mock_urlopen.call_args.args[0].get_header("Range") is None
+        assert filepath.read_bytes() == b"full"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tailwindcss"]
+
+    def test_unsatisfiable_range_restarts_download(self, tmp_path: Path):
+        filepath = tmp_path / "tailwindcss"
+        _write_partial(filepath, b"stale", '"v1"')
+        response = _build_response_mock(code=200, content_length="4", body=b"full")
+        unsatisfiable = UrllibHTTPError(
+            url="https://example.com/file.bin",
+            code=416,
+            msg="Range Not Satisfiable",
+            hdrs={},  # pyright: ignore[reportArgumentType]
+            fp=None,
+        )
+
+        with patch("django_tailwind_cli.utils.http.urlopen", side_effect=[unsatisfiable, response]) as mock_urlopen:
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert mock_urlopen.call_count == 2
+        assert mock_urlopen.call_args.args[0].get_header("Range") is None
+        assert filepath.read_bytes() == b"full"
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["tailwindcss"]
+
+    def test_short_body_is_not_moved_into_place(self, tmp_path: Path):
+        response = _build_response_mock(code=200, content_length="1000", body=b"A" * 500)
+        filepath = tmp_path / "tailwindcss"
+
+        with patch("django_tailwind_cli.utils.http.urlopen", return_value=response):
+            with pytest.raises(http.RequestError, match="got 500 of 1000 bytes"):
+                http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert not filepath.exists()
+        assert (tmp_path / "tailwindcss.part").read_bytes() == b"A" * 500
+
     def test_download_without_callback_still_writes_file(self, tmp_path: Path):
         body = b"hello world"
         response = _build_response_mock(code=200, content_length=str(len(body)), body=body)
@@ -313,6 +484,47 @@ class TestDownloadWithProgressErrorBranches:
             with pytest.raises(http.HTTPError, match="HTTP 500"):
                 http.download_with_progress("https://example.com/file.bin", filepath)
 
+    def test_transient_gateway_error_is_retried(self, tmp_path: Path):
+        body = b"data"
+        response = _build_response_mock(code=200, content_length=str(len(body)), body=body)
+        error = UrllibHTTPError(
+            url="https://example.com",
+            code=503,
+            msg="Service Unavailable",
+            hdrs={},  # pyright: ignore[reportArgumentType]
+            fp=None,
+        )
+        filepath = tmp_path / "test.bin"
+
+        with (
+            patch("django_tailwind_cli.utils.http.urlopen", side_effect=[error, response]) as mock_urlopen,
+            patch("django_tailwind_cli.utils.http.time.sleep") as mock_sleep,
+        ):
+            http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert mock_urlopen.call_count == 2
+        mock_sleep.assert_called_once_with(http._DOWNLOAD_RETRY_BACKOFF)
+        assert filepath.read_bytes() == body
+
+    def test_gateway_error_raises_after_retries_exhausted(self, tmp_path: Path):
+        error = UrllibHTTPError(
+            url="https://example.com",
+            code=502,
+            msg="Bad Gateway",
+            hdrs={},  # pyright: ignore[reportArgumentType]
+            fp=None,
+        )
+        filepath = tmp_path / "test.bin"
+
+        with (
+            patch("django_tailwind_cli.utils.http.urlopen", side_effect=error) as mock_urlopen,
+            patch("django_tailwind_cli.utils.http.time.sleep"),
+        ):
+            with pytest.raises(http.HTTPError, match="HTTP 502"):
+                http.download_with_progress("https://example.com/file.bin", filepath)
+
+        assert mock_urlopen.call_count == http._DOWNLOAD_RETRIES + 1
+
     def test_generic_urlerror_raises_request_error(self, tmp_path: Path):
         """URLError with a non-timeout, non-connection reason."""
         filepath = tmp_path / "test.bin"
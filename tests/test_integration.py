@@ -9,6 +9,8 @@ import io
 import os
 import platform
 import signal
+import subprocess
+import sys
 import threading
 import time
 from pathlib import Path
@@ -553,6 +555,35 @@ class TestProcessManagerIntegration:
         mock_process.terminate.assert_not_called()
         assert manager.processes == []
 
+    @pytest.mark.timeout(10)
+    @pytest.mark.parametrize("manager_cls", [ProcessManager, MultiWatchProcessManager])
+    def test_process_manager_monitor_wakes_on_child_crash(self, manager_cls: type):
+        """A crashing child must end monitoring immediately, without waiting on a poll interval."""
+        manager = manager_cls()
+        manager.processes = [
+            subprocess.Popen([sys.executable, "-c", "import sys; sys.exit(3)"], text=True),
+            subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"], text=True),
+        ]
+        try:
+            manager._monitor_processes()
+            assert manager.shutdown_requested is True
+            assert manager.processes[0].returncode == 3
+        finally:
+            manager._cleanup_processes()
+
+    @pytest.mark.timeout(10)
+    @pytest.mark.parametrize("manager_cls", [ProcessManager, MultiWatchProcessManager])
+    def test_process_manager_monitor_wakes_on_shutdown_request(self, manager_cls: type):
+        """A shutdown request from another thread must unblock the monitor loop."""
+        manager = manager_cls()
+        manager.processes = [subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"], text=True)]
+        threading.Timer(0.1, manager._request_shutdown).start()
+        try:
+            manager._monitor_processes()
+            assert manager.shutdown_requested is True
+        finally:
+            manager._cleanup_processes()
+
     @pytest.mark.parametrize("manager_cls", [ProcessManager, MultiWatchProcessManager])
     def test_signal_handler_flips_shutdown_flag_without_cleanup(self, manager_cls: type):
         """Handler must only flip the flag — cleanup is owned by start_xxx' finally."""
@@ -580,6 +611,26 @@ class TestProcessManagerIntegration:
         finally:
             signal.signal(signal.SIGTERM, original)
 
+    def test_start_concurrent_processes_restores_previous_sigterm_handler(self, mocker: MockerFixture):
+        """The SIGTERM handler is only borrowed while the processes run."""
+
+        def previous_handler(signum: int, frame: Any) -> None:  # pragma: no cover - never invoked
+            pass
+
+        mocker.patch("subprocess.Popen")
+        manager = ProcessManager()
+        installed: list[Any] = []
+        mocker.patch.object(
+            manager, "_monitor_processes", side_effect=lambda: installed.append(signal.getsignal(signal.SIGTERM))
+        )
+        original = signal.signal(signal.SIGTERM, previous_handler)
+        try:
+            manager.start_concurrent_processes(["watch"], ["server"])
+            assert installed == [manager._signal_handler]
+            assert signal.getsignal(signal.SIGTERM) is previous_handler
+        finally:
+            signal.signal(signal.SIGTERM, original)
+
     @pytest.mark.parametrize("manager_cls", [ProcessManager, MultiWatchProcessManager])
     def test_signal_handler_is_idempotent(self, manager_cls: type, capsys: CaptureFixture[str]):
         """Repeated SIGTERMs must produce a single shutdown message (e.g. when pkill matches both wrapper and child)."""
@@ -5,6 +5,7 @@ by implementing better mocking strategies, timeouts, and process management.
 """
 # pyright: reportPrivateUsage=false
 
+import subprocess
 from pathlib import Path
 from collections.abc import Callable
 from typing import Any
@@ -268,6 +269,22 @@ class TestSubprocessCommands:
         # Should call subprocess for watch mode
         assert self.mock_subprocess_run.call_count >= 1
 
+    @pytest.mark.parametrize("verbose, expected_stdout", [(False, subprocess.DEVNULL), (True, subprocess.PIPE)])
+    def test_build_captures_stdout_only_when_verbose(self, verbose: bool, expected_stdout: int):
+        """stdout is only piped when it will be shown; stderr is always kept for errors."""
+        call_command("tailwind", "build", "--force", *(["--verbose"] if verbose else []))
+
+        kwargs = self.mock_subprocess_run.call_args.kwargs
+        assert kwargs["stdout"] == expected_stdout
+        assert kwargs["stderr"] == subprocess.PIPE
+
+    @pytest.mark.timeout(5)
+    def test_watch_does_not_capture_output(self):
+        """The watcher streams its output instead of buffering it until exit."""
+        call_command("tailwind", "watch")
+
+        assert "capture_output" not in self.mock_subprocess_run.call_args.kwargs
+
     @pytest.mark.timeout(5)
     def test_watch_with_keyboard_interrupt(self, capsys: CaptureFixture[str]):
         """Test watch command handling of KeyboardInterrupt."""
@@ -325,6 +342,16 @@ class TestProcessManagementCommands:
         mock_instance = self.mock_process_manager.return_value
         mock_instance.start_concurrent_processes.assert_called_once()
 
+    @pytest.mark.timeout(3)
+    def test_runserver_probes_django_extensions_once(self):
+        """The django-extensions/werkzeug lookup is memoized for the process."""
+        self.mock_find_spec.return_value = None
+
+        call_command("tailwind", "runserver")
+        call_command("tailwind", "runserver")
+
+        self.mock_find_spec.assert_called_once_with("django_extensions")
+
     @pytest.mark.timeout(3)
     def test_runserver_with_django_extensions(self):
         """Test runserver when django-extensions is available."""
@@ -736,6 +763,158 @@ class TestDefaultGitignore:
         assert not (tmp_path / ".django_tailwind_cli").exists()
 
 
+class TestFileHelpers:
+    """Tests for the filesystem helpers used by build, watch and setup."""
+
+    def test_should_recreate_file_when_missing(self, tmp_path: Path):
+        from django_tailwind_cli.management.commands.tailwind import _should_recreate_file
+
+        assert _should_recreate_file(tmp_path / "source.css", DEFAULT_SOURCE_CSS.encode()) is True
+
+    @pytest.mark.parametrize(
+        "existing, expected",
+        [
+            (DEFAULT_SOURCE_CSS, False),
+            (DAISY_UI_SOURCE_CSS, True),  # different size
+            (DEFAULT_SOURCE_CSS.replace("tailwindcss", "tailwindCSS"), True),  # same size, different bytes
+        ],
+    )
+    def test_should_recreate_file_compares_content(self, tmp_path: Path, existing: str, expected: bool):
+        from django_tailwind_cli.management.commands.tailwind import _should_recreate_file
+
+        source = tmp_path / "source.css"
+        source.write_text(existing)
+        assert _should_recreate_file(source, DEFAULT_SOURCE_CSS.encode()) is expected
+
+    def test_check_file_exists_cached_reuses_result_within_bucket(self, tmp_path: Path, mocker: MockerFixture):
+        from django_tailwind_cli.management.commands import tailwind
+
+        cli = tmp_path / "tailwindcss"
+        monotonic = mocker.patch.object(tailwind.time, "monotonic", return_value=100.0)
+        assert tailwind._check_file_exists_cached(cli) is False
+
+        cli.touch()
+        assert tailwind._check_file_exists_cached(cli) is False  # still cached
+
+        monotonic.return_value = 105.0  # next 5s bucket
+        assert tailwind._check_file_exists_cached(cli) is True
+
+    def test_check_file_exists_cached_keys_on_cache_duration(self, tmp_path: Path, mocker: MockerFixture):
+        from django_tailwind_cli.management.commands import tailwind
+
+        cli = tmp_path / "tailwindcss"
+        monotonic = mocker.patch.object(tailwind.time, "monotonic", return_value=100.0)
+        assert tailwind._check_file_exists_cached(cli, cache_duration=5.0) is False  # bucket 20
+
+        cli.touch()
+        monotonic.return_value = 1000.0
+        # Also bucket 20, but of a different duration and a much later window
+        assert tailwind._check_file_exists_cached(cli, cache_duration=50.0) is True
+
+    def test_download_progress_is_reported_once_per_ten_percent(
+        self, tmp_path: Path, mocker: MockerFixture, capsys: CaptureFixture[str]
+    ):
+        from django_tailwind_cli.management.commands.tailwind import _download_cli_with_progress
+
+        def fake_download(url: str, filepath: Path, timeout: int, progress_callback: Callable[[int, int, float], None]):
+            for progress in (2.0, 11.0, 12.0, 19.9, 47.0, 100.0):
+                progress_callback(int(progress), 100, progress)
+
+        mocker.patch("django_tailwind_cli.utils.http.download_with_progress", side_effect=fake_download)
+        _download_cli_with_progress("https://example.com/tailwindcss", tmp_path / "tailwindcss")
+
+        reported = [line for line in capsys.readouterr().out.splitlines() if line.startswith("Progress:")]
+        assert [line.split("%")[0] for line in reported] == ["Progress: 11.0", "Progress: 47.0", "Progress: 100.0"]
+
+    def test_forced_download_discards_partial_download(self, tmp_path: Path, mocker: MockerFixture):
+        from django_tailwind_cli.management.commands.tailwind import _download_cli_with_progress
+
+        filepath = tmp_path / "tailwindcss"
+        (tmp_path / "tailwindcss.part").write_bytes(b"stale")
+        (tmp_path / "tailwindcss.part.validator").write_text('"v1"')
+        download = mocker.patch("django_tailwind_cli.utils.http.download_with_progress")
+
+        _download_cli_with_progress("https://example.com/tailwindcss", filepath, resume=False)
+
+        download.assert_called_once()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_stat_pair_reports_missing_files_as_none(self, tmp_path: Path):
+        from django_tailwind_cli.management.commands.tailwind import _should_rebuild_css, _stat_pair
+
+        src = tmp_path / "source.css"
+        src.write_text(DEFAULT_SOURCE_CSS)
+        src_stat, dist_stat = _stat_pair(src, tmp_path / "missing.css")
+        assert src_stat is not None
+        assert dist_stat is None
+        assert _should_rebuild_css(src_stat, dist_stat) is True
+
+    def test_should_rebuild_css_compares_mtimes(self, tmp_path: Path):
+        import os
+
+        from django_tailwind_cli.management.commands.tailwind import _should_rebuild_css, _stat_pair
+
+        src = tmp_path / "source.css"
+        dist = tmp_path / "tailwind.css"
+        src.write_text(DEFAULT_SOURCE_CSS)
+        dist.write_text("/* built */")
+        os.utime(src, (1_000, 1_000))
+        os.utime(dist, (2_000, 2_000))
+        assert _should_rebuild_css(*_stat_pair(src, dist)) is False
+
+        os.utime(src, (3_000, 3_000))
+        assert _should_rebuild_css(*_stat_pair(src, dist)) is True
+
+        # Sub-microsecond differences still count
+        os.utime(src, ns=(2_000_000_000_001, 2_000_000_000_001))
+        os.utime(dist, ns=(2_000_000_000_000, 2_000_000_000_000))
+        assert _should_rebuild_css(*_stat_pair(src, dist)) is True
+
+    def test_prewarm_cli_hints_page_cache(self, tmp_path: Path, mocker: MockerFixture):
+        import os
+
+        from django_tailwind_cli.management.commands.tailwind import _prewarm_cli
+
+        if not hasattr(os, "posix_fadvise"):
+            pytest.skip("posix_fadvise is not available on this platform")
+
+        cli = tmp_path / "tailwindcss"
+        cli.write_bytes(b"binary")
+        fadvise = mocker.patch("os.posix_fadvise")
+
+        _prewarm_cli(cli)
+        fadvise.assert_called_once_with(mocker.ANY, 0, 0, os.POSIX_FADV_WILLNEED)
+
+        fadvise.reset_mock()
+        _prewarm_cli(tmp_path / "missing")  # best-effort: never raises
+        fadvise.assert_not_called()
+
+    def test_is_cli_up_to_date_checks_existence_and_mode(self, tmp_path: Path):
+        from django_tailwind_cli.management.commands.tailwind import _is_cli_up_to_date
+
+        cli = tmp_path / "tailwindcss"
+        assert _is_cli_up_to_date(cli, "4.0.0") is False
+
+        cli.write_bytes(b"")
+        cli.chmod(0o644)
+        assert _is_cli_up_to_date(cli, "4.0.0") is False
+
+        cli.chmod(0o755)
+        assert _is_cli_up_to_date(cli, "4.0.0") is True
+
+    def test_is_cli_up_to_date_requires_execute_permission_for_current_user(
+        self, tmp_path: Path, mocker: MockerFixture
+    ):
+        from django_tailwind_cli.management.commands.tailwind import _is_cli_up_to_date
+
+        cli = tmp_path / "tailwindcss"
+        cli.write_bytes(b"")
+        cli.chmod(0o700)
+        # Executable by its owner only, and the current user is someone else
+        mocker.patch("django_tailwind_cli.management.commands.tailwind.os.access", return_value=False)
+        assert _is_cli_up_to_date(cli, "4.0.0") is False
+
+
 # Configuration to run tests with appropriate markers
 pytestmark = [
     pytest.mark.filterwarnings("ignore::DeprecationWarning"),